@@ -3,7 +3,7 @@ from unittest import mock
 
 import pandas as pd
 
-from trading_bot.main import send_alert
+from trading_bot.main import _ALERT_QUEUE, send_alert
 
 
 def test_send_alert_outputs(caplog):
@@ -16,4 +16,24 @@ def test_send_alert_outputs(caplog):
         with caplog.at_level(logging.INFO):
             send_alert(signal)
         assert any("ALERT: BUY" in r.message for r in caplog.records)
+        # Notifications are delivered asynchronously; wait for the worker
+        _ALERT_QUEUE.join()
         mock_notify.notify.assert_called_once()
+
+
+def test_send_alerts_batches_notification(caplog):
+    from trading_bot.main import send_alerts
+
+    signals = [
+        {"timestamp": pd.Timestamp("2024-01-01 10:00:00") + pd.Timedelta(minutes=i), "action": "buy", "price": 1.0 + i}
+        for i in range(7)
+    ]
+    with mock.patch("trading_bot.main.notification") as mock_notify:
+        with caplog.at_level(logging.INFO):
+            send_alerts(signals)
+        assert sum("ALERT: BUY" in r.message for r in caplog.records) == 7
+        _ALERT_QUEUE.join()
+        mock_notify.notify.assert_called_once()
+        message = mock_notify.notify.call_args.kwargs["message"]
+        assert len(message.splitlines()) == 5
+        assert "price $7.00" in message
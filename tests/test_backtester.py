@@ -199,3 +199,30 @@ def test_fees_slippage_pnl_consistency():
     fee_sell = sell_exec * 10 / 10_000
     expected = (sell_exec - buy_exec) - (fee_buy + fee_sell)
     assert stats["net_pnl"] == pytest.approx(expected)
+
+
+def test_generate_signals_memoises_identical_calls():
+    from trading_bot.backtester import clear_signal_cache
+
+    timestamps = pd.date_range("2024-01-01", periods=5, freq="1min")
+    df = pd.DataFrame({"timestamp": timestamps, "close": [100 + i for i in range(5)]})
+    calls = []
+
+    def counting_strategy(df, window=2):
+        calls.append(window)
+        return [{"timestamp": df["timestamp"].iloc[-1], "action": "buy", "price": 1.0}]
+
+    STRATEGY_REGISTRY["counting"] = Strategy(counting_strategy)
+    try:
+        first = generate_signals(df, strategy="counting", window=2)
+        first[0]["strategy"] = "tagged"
+        second = generate_signals(df.copy(), strategy="counting", window=2)
+        generate_signals(df, strategy="counting", window=3)
+        changed = df.assign(close=df["close"] + 1)
+        generate_signals(changed, strategy="counting", window=2)
+    finally:
+        del STRATEGY_REGISTRY["counting"]
+        clear_signal_cache()
+
+    assert calls == [2, 3, 2]
+    assert "strategy" not in second[0]
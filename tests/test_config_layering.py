@@ -3,7 +3,7 @@ import sys
 
 import pytest
 
-from trading_bot.config import load_config
+from trading_bot.config import get_config, load_config
 from trading_bot.main import parse_args
 
 
@@ -108,3 +108,37 @@ def test_invalid_confluence_required_raises(tmp_path):
     config_path.write_text(json.dumps(base))
     with pytest.raises(ValueError):
         load_config(config_dir=str(tmp_path))
+
+
+def test_load_config_rereads_changed_files(tmp_path, monkeypatch):
+    base = {
+        "symbol": "BTC/USDT",
+        "timeframe": "1m",
+        "limit": 500,
+        "sma_short": 5,
+        "sma_long": 20,
+        "trade_size": 1.0,
+        "rsi_period": 14,
+        "rsi_lower": 30,
+        "rsi_upper": 70,
+        "confluence": {"members": ["sma", "rsi"], "required": 1},
+    }
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(base))
+
+    first = load_config(config_dir=str(tmp_path))
+    first["symbol"] = "mutated"
+    assert load_config(config_dir=str(tmp_path))["symbol"] == "BTC/USDT"
+
+    local_path = tmp_path / "config.local.json"
+    local_path.write_text(json.dumps({"symbol": "ETH/USDT"}))
+    assert load_config(config_dir=str(tmp_path))["symbol"] == "ETH/USDT"
+
+    monkeypatch.setenv("TRADING_BOT_EXCHANGE", "kraken")
+    assert load_config(config_dir=str(tmp_path))["exchange"] == "kraken"
+
+
+def test_get_config_is_read_only():
+    config = get_config()
+    with pytest.raises(TypeError):
+        config["symbol"] = "DOGE/USDT"  # type: ignore[index]
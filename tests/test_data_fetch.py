@@ -1,3 +1,6 @@
+import threading
+import time
+
 import ccxt
 import pytest
 
@@ -33,6 +36,7 @@ def test_fetch_uses_provided_exchange():
 def test_fetch_with_exchange_name(monkeypatch):
     exch = DummyExchange()
     monkeypatch.setattr(data_fetch, "create_exchange", lambda **kwargs: exch)
+    monkeypatch.setattr(data_fetch, "_SHARED_EXCHANGES", {})
     df = fetch_market_data(exchange_name="dummy")
     assert not df.empty
 
@@ -40,3 +44,62 @@ def test_fetch_with_exchange_name(monkeypatch):
 def test_fetch_raises_on_error():
     with pytest.raises(ccxt.BaseError):
         fetch_market_data(exchange=FailingExchange())
+
+
+def test_fetch_reuses_exchange_without_credentials(monkeypatch):
+    created = []
+
+    def fake_create(**kwargs):
+        created.append(kwargs)
+        return DummyExchange()
+
+    monkeypatch.setattr(data_fetch, "create_exchange", fake_create)
+    monkeypatch.setattr(data_fetch, "_SHARED_EXCHANGES", {})
+    fetch_market_data(exchange_name="dummy")
+    fetch_market_data(exchange_name="dummy")
+    assert len(created) == 1
+
+
+def test_fetches_through_one_client_do_not_overlap():
+    class SlowExchange:
+        id = "slow"
+
+        def __init__(self):
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.guard = threading.Lock()
+
+        def fetch_ohlcv(self, symbol, timeframe, limit=500):
+            with self.guard:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.02)
+            with self.guard:
+                self.in_flight -= 1
+            return [[0, 1, 2, 0, 1, 100]]
+
+    exch = SlowExchange()
+    threads = [threading.Thread(target=fetch_market_data, kwargs={"exchange": exch}) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert exch.max_in_flight == 1
+
+
+def test_shared_exchange_is_created_once_across_threads(monkeypatch):
+    created = []
+
+    def slow_create(**kwargs):
+        time.sleep(0.02)
+        created.append(kwargs)
+        return DummyExchange()
+
+    monkeypatch.setattr(data_fetch, "create_exchange", slow_create)
+    monkeypatch.setattr(data_fetch, "_SHARED_EXCHANGES", {})
+    threads = [threading.Thread(target=fetch_market_data, kwargs={"exchange_name": "dummy"}) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(created) == 1
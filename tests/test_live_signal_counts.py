@@ -0,0 +1,96 @@
+import importlib
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from trading_bot.broker import PaperBroker
+
+
+def test_live_mode_counts_all_signals_but_trades_recent(monkeypatch, tmp_path):
+    from prometheus_client import REGISTRY
+
+    main = importlib.import_module("trading_bot.main")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    signals = [{"action": "buy", "price": 10.0, "timestamp": start + timedelta(minutes=i)} for i in range(5)]
+
+    candles = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start, periods=5, freq="1min"),
+            "open": 10.0,
+            "high": 10.0,
+            "low": 10.0,
+            "close": 10.0,
+            "volume": 1.0,
+        }
+    )
+    monkeypatch.setattr(main, "fetch_market_data", lambda *a, **k: candles)
+    monkeypatch.setattr(main, "_bind_strategy", lambda *a, **k: lambda df: [dict(s) for s in signals])
+    monkeypatch.setattr(main, "mark_signal_handled", lambda *a, **k: False)
+    stored = []
+    monkeypatch.setattr(main, "log_signals_batch", lambda batch, **k: stored.extend(batch))
+
+    def stop_sleep(_):
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(main.time, "sleep", stop_sleep)
+
+    before = REGISTRY.get_sample_value("signals_generated_total") or 0.0
+    broker = PaperBroker(starting_cash=1000, fees_bps=0, slippage_bps=0)
+    with pytest.raises(KeyboardInterrupt):
+        main.run_live_mode(
+            ["CNT/USDT"],
+            "1m",
+            2,
+            3,
+            broker=broker,
+            trade_amount=1,
+            interval_seconds=1,
+            state_dir=str(tmp_path),
+        )
+
+    assert REGISTRY.get_sample_value("signals_generated_total") - before == 5
+    assert [len(batch) for _, batch in stored] == [5]
+    assert broker.get_open_positions() == {"CNT/USDT": pytest.approx(main._LIVE_SIGNAL_TAIL)}
+
+
+def test_live_mode_does_not_recount_unchanged_candles(monkeypatch, tmp_path):
+    from prometheus_client import REGISTRY
+
+    main = importlib.import_module("trading_bot.main")
+    # The newest candle is still open, so every poll reuses the same frame
+    now = pd.Timestamp.now(tz="UTC").floor("1h")
+    candles = pd.DataFrame({"timestamp": [now], "open": 10.0, "high": 10.0, "low": 10.0, "close": 10.0, "volume": 1.0})
+    signal = {"action": "buy", "price": 10.0, "timestamp": now}
+
+    monkeypatch.setattr(main, "fetch_market_data", lambda *a, **k: candles)
+    monkeypatch.setattr(main, "_bind_strategy", lambda *a, **k: lambda df: [dict(signal)])
+    monkeypatch.setattr(main, "mark_signal_handled", lambda *a, **k: False)
+    stored = []
+    monkeypatch.setattr(main, "log_signals_batch", lambda batch, **k: stored.extend(batch))
+
+    sleeps = []
+
+    def stop_after_three_polls(_):
+        sleeps.append(1)
+        if len(sleeps) == 3:
+            raise KeyboardInterrupt()
+
+    monkeypatch.setattr(main.time, "sleep", stop_after_three_polls)
+
+    before = REGISTRY.get_sample_value("signals_generated_total") or 0.0
+    broker = PaperBroker(starting_cash=1000, fees_bps=0, slippage_bps=0)
+    with pytest.raises(KeyboardInterrupt):
+        main.run_live_mode(
+            ["UNCH/USDT"],
+            "1h",
+            2,
+            3,
+            broker=broker,
+            trade_amount=1,
+            interval_seconds=1,
+            state_dir=str(tmp_path),
+        )
+
+    assert REGISTRY.get_sample_value("signals_generated_total") - before == 1
+    assert [sym for sym, _ in stored] == ["UNCH/USDT"]
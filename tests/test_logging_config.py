@@ -25,3 +25,16 @@ def test_json_logging(tmp_path):
     record = json.loads(line)
     assert record["message"] == "json message"
     assert record["level"] == "INFO"
+
+
+def test_setup_logging_reuses_handlers_for_same_destination(tmp_path):
+    setup_logging(level="INFO", state_dir=str(tmp_path))
+    handlers = list(logging.getLogger().handlers)
+    setup_logging(level="DEBUG", state_dir=str(tmp_path))
+    assert logging.getLogger().handlers == handlers
+    assert logging.getLogger().level == logging.DEBUG
+
+    setup_logging(level="INFO", state_dir=str(tmp_path), json_logs=True)
+    assert logging.getLogger().handlers != handlers
+    # Handlers that were replaced have their files closed
+    assert all(getattr(h, "stream", None) is None for h in handlers if hasattr(h, "baseFilename"))
@@ -148,6 +148,19 @@ def test_signal_logging():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def test_signal_logging_appends_to_daily_file(tmp_path):
+    from trading_bot.main import log_signals_to_file
+
+    signals = [{"timestamp": pd.Timestamp("2024-01-01 10:00:00"), "action": "buy", "price": 50000.0}]
+    log_signals_to_file(signals, "BTC/USDT", state_dir=str(tmp_path))
+    log_signals_to_file(signals, "ETH/USDT", state_dir=str(tmp_path))
+
+    files = list((tmp_path / "logs").glob("*_signals.log"))
+    assert len(files) == 1
+    text = files[0].read_text()
+    assert "BUY | BTC/USDT" in text and "BUY | ETH/USDT" in text
+
+
 def test_live_mode_argument_parsing():
     """Test that the live subcommand is parsed correctly."""
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "trading_bot"))
@@ -226,6 +239,18 @@ def test_log_order_to_file(tmp_path):
     assert "BTC/USDT" in log_file.read_text()
 
 
+def test_log_order_to_file_reuses_handle(tmp_path):
+    from trading_bot.main import _LOG_HANDLES, log_order_to_file
+
+    order = {"id": "1", "amount": 1, "price": 100.0, "side": "buy"}
+    log_order_to_file(order, "BTC/USDT", state_dir=str(tmp_path))
+    log_order_to_file({**order, "id": "2"}, "ETH/USDT", state_dir=str(tmp_path))
+    log_path = str(tmp_path / "logs" / "orders.log")
+    assert log_path in _LOG_HANDLES
+    lines = (tmp_path / "logs" / "orders.log").read_text().splitlines()
+    assert len(lines) == 2 and "ETH/USDT" in lines[1]
+
+
 def test_log_signals_to_file_error(tmp_path, caplog, monkeypatch):
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "trading_bot"))
     from main import log_signals_to_file
@@ -254,3 +279,132 @@ def test_log_order_to_file_error(tmp_path, caplog, monkeypatch):
     with caplog.at_level(logging.ERROR):
         log_order_to_file(order, "BTC/USDT", state_dir=str(tmp_path))
     assert any("Failed to log order" in r.message for r in caplog.records)
+
+
+def test_fetch_candles_reuses_open_candle(monkeypatch):
+    import trading_bot.main as main_module
+
+    calls = []
+    last_open = {"ts": pd.Timestamp.now(tz="UTC")}
+
+    def fake_fetch(symbol, timeframe, limit, exchange=None):
+        calls.append(symbol)
+        return pd.DataFrame({"timestamp": [last_open["ts"]], "close": [1.0]})
+
+    monkeypatch.setattr(main_module, "fetch_market_data", fake_fetch)
+    monkeypatch.setattr(main_module, "_CANDLE_CACHE", {})
+
+    main_module._fetch_candles("BTC/USDT", "1h", 5)
+    main_module._fetch_candles("BTC/USDT", "1h", 5)
+    assert calls == ["BTC/USDT"]
+
+    # Once the cached candle's period is over a new fetch is made
+    last_open["ts"] = pd.Timestamp("2024-01-01", tz="UTC")
+    monkeypatch.setattr(main_module, "_CANDLE_CACHE", {})
+    main_module._fetch_candles("BTC/USDT", "1h", 5)
+    main_module._fetch_candles("BTC/USDT", "1h", 5)
+    assert len(calls) == 3
+
+
+def test_cached_candles_skip_repeating_analysis(monkeypatch, tmp_path):
+    import trading_bot.main as main_module
+
+    frame = pd.DataFrame({"timestamp": [pd.Timestamp.now(tz="UTC")], "close": [1.0]})
+    monkeypatch.setattr(main_module, "fetch_market_data", lambda *a, **k: frame)
+    monkeypatch.setattr(main_module, "_CANDLE_CACHE", {})
+    monkeypatch.setattr(main_module, "_ANALYSED_CANDLES", {})
+    runs = []
+
+    def strategy(df):
+        runs.append(df)
+        return [{"timestamp": df["timestamp"].iloc[-1], "action": "buy", "price": 1.0}]
+
+    results = [
+        main_module.run_single_analysis(
+            "BTC/USDT",
+            "1h",
+            5,
+            5,
+            20,
+            state_dir=str(tmp_path),
+            log_to_db=False,
+            cache_candles=True,
+            strategy_call=strategy,
+        )
+        for _ in range(2)
+    ]
+    assert results[0][0]["action"] == "buy"
+    # Unchanged candles report no new signals
+    assert results[1] == []
+    assert len(runs) == 1
+    # The reused result is not written to the signal log a second time
+    (log_file,) = (tmp_path / "logs").glob("*_signals.log")
+    assert log_file.read_text().count("BUY | BTC/USDT") == 1
+
+
+def test_fetch_candles_only_requests_new_candles(monkeypatch):
+    import trading_bot.main as main_module
+
+    now = pd.Timestamp.now(tz="UTC").floor("1min")
+    window = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(now - pd.Timedelta(minutes=6), periods=5, freq="1min"),
+            "close": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+    requested = []
+
+    def fake_fetch(symbol, timeframe, limit, exchange=None):
+        requested.append(limit)
+        # The previously open candle (now closed) plus the ones since
+        return pd.DataFrame(
+            {
+                "timestamp": pd.date_range(now - pd.Timedelta(minutes=2), periods=3, freq="1min"),
+                "close": [5.5, 6.0, 7.0],
+            }
+        )
+
+    monkeypatch.setattr(main_module, "fetch_market_data", fake_fetch)
+    monkeypatch.setattr(main_module, "_CANDLE_CACHE", {("BTC/USDT", "1m", 5): window})
+
+    data = main_module._fetch_candles("BTC/USDT", "1m", 5)
+    assert requested == [3]
+    assert data["close"].tolist() == [3.0, 4.0, 5.5, 6.0, 7.0]
+
+
+def test_signal_logging_skips_signals_logged_this_session(monkeypatch, tmp_path):
+    import trading_bot.main as main_module
+
+    first = {"timestamp": pd.Timestamp("2024-01-01 10:00:00"), "action": "buy", "price": 1.0}
+    second = {"timestamp": pd.Timestamp("2024-01-01 11:00:00"), "action": "sell", "price": 2.0}
+    monkeypatch.setattr(main_module, "fetch_market_data", lambda *a, **k: pd.DataFrame({"close": [1.0]}))
+
+    def analyse(window, logged_through=None):
+        main_module.run_single_analysis(
+            "BTC/USDT",
+            "1m",
+            5,
+            5,
+            20,
+            state_dir=str(tmp_path),
+            log_to_db=False,
+            strategy_call=lambda df: [dict(s) for s in window],
+            logged_through=logged_through,
+        )
+
+    session: dict = {}
+    analyse([first], session)
+    analyse([first, second], session)
+    analyse([first, second], session)
+    assert session == {"BTC/USDT": second["timestamp"]}
+
+    (log_file,) = (tmp_path / "logs").glob("*_signals.log")
+    text = log_file.read_text()
+    assert text.count("BUY | BTC/USDT") == 1
+    assert text.count("SELL | BTC/USDT") == 1
+    assert text.count("Trading Signals Log") == 2
+
+    # Without a session mapping every analysis is written, e.g. a second
+    # one-shot run or another strategy in the same process
+    analyse([first, second])
+    assert log_file.read_text().count("BUY | BTC/USDT") == 2
@@ -35,3 +35,35 @@ def test_compute_equity_curve_basic():
     assert round(stats["win_rate"], 2) == 100.0
     assert stats["total_return_abs"] == pytest.approx(20.0)
     assert stats["max_drawdown"] == pytest.approx(0.0)
+
+
+def test_compute_equity_curve_skips_unaffordable_buys_and_applies_fees():
+    ts = pd.date_range("2024-01-01", periods=4, freq="h", tz="UTC")
+    signals = [
+        {"timestamp": ts[0], "action": "BUY", "price": 100},
+        {"timestamp": ts[1], "action": "buy", "price": 100},  # not enough cash left
+        {"timestamp": ts[2], "action": "sell", "price": 120},
+        {"timestamp": ts[3], "action": "sell", "price": 130},  # nothing left to sell
+    ]
+
+    df, stats = compute_equity_curve(signals, initial_balance=150, trade_size=1.0, fees_bps=100)
+
+    assert list(df["timestamp"]) == list(ts)
+    assert list(df["equity"]) == pytest.approx([149.0, 149.0, 167.8, 167.8])
+    assert stats["num_trades"] == 1
+    assert stats["win_rate"] == pytest.approx(100.0)
+    assert stats["total_return_abs"] == pytest.approx(17.8)
+
+
+def test_compute_equity_curve_orders_unsorted_signals():
+    signals = [
+        {"timestamp": pd.Timestamp("2024-01-01 02:00:00"), "action": "sell", "price": 120},
+        {"timestamp": "2024-01-01 00:00:00", "action": "buy", "price": 100},
+        {"timestamp": pd.Timestamp("2024-01-01 01:00:00"), "action": "buy", "price": 110},
+    ]
+
+    df, stats = compute_equity_curve(signals, initial_balance=1000)
+
+    assert df["timestamp"].is_monotonic_increasing
+    assert list(df["equity"]) == pytest.approx([1000.0, 1010.0, 1030.0])
+    assert stats["num_trades"] == 1
@@ -135,3 +135,16 @@ def test_sell_closes_position_and_clears_price():
     p.sell("BTC", 1, 110, fee_bps=0)
     assert "BTC" not in p.positions
     assert "BTC" not in p.last_prices
+
+
+def test_position_value_refreshes_after_trades_and_price_moves():
+    p = Portfolio(cash=1000)
+    p.buy("BTC", 1, 100)
+    assert p.equity({"BTC": 120}) == pytest.approx(900 + 120)
+    # Prices for symbols without a position do not change the valuation
+    assert p.equity({"ETH": 50}) == pytest.approx(900 + 120)
+    p.buy("ETH", 2, 50)
+    assert p.equity() == pytest.approx(800 + 120 + 100)
+    assert p.equity({"BTC": 130}) == pytest.approx(800 + 130 + 100)
+    p.sell("BTC", 1, 130)
+    assert p.equity() == pytest.approx(930 + 100)
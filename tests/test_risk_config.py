@@ -36,6 +36,35 @@ def test_cli_override():
         sys.argv = original
 
 
+def test_cli_override_equals_syntax():
+    original = sys.argv
+    try:
+        sys.argv = [
+            "main.py",
+            "live",
+            "--risk.slippage_bps=8",
+            "--risk.position_sizing.mode",
+            "fixed_cash",
+        ]
+        args = parse_args()
+        assert args.risk_overrides == {
+            "slippage_bps": "8",
+            "position_sizing.mode": "fixed_cash",
+        }
+    finally:
+        sys.argv = original
+
+
+def test_cli_rejects_unrecognized_arguments():
+    original = sys.argv
+    try:
+        sys.argv = ["main.py", "live", "--risk.slippage_bps", "8", "--bogus"]
+        with pytest.raises(SystemExit):
+            parse_args()
+    finally:
+        sys.argv = original
+
+
 def test_position_sizing_invalid_mode():
     with pytest.raises(ValueError):
         PositionSizingConfig(mode="unknown")
@@ -13,3 +13,16 @@ def test_mark_signal_handled(tmp_path):
     assert first is False
     second = mark_signal_handled("BTC/USDT", "sma", "1m", ts, "buy", db_path=str(db_file))
     assert second is True
+
+
+def test_mark_signal_handled_remembers_keys_in_process(tmp_path):
+    import sqlite3
+
+    db_file = str(tmp_path / "signals.db")
+    ts = pd.Timestamp("2024-01-01 00:00:00").isoformat()
+    assert mark_signal_handled("BTC/USDT", "sma", "1m", ts, "buy", db_path=db_file) is False
+
+    # Repeats are answered from memory, without touching the database
+    conn = sqlite3.connect(db_file)
+    conn.close()
+    assert mark_signal_handled("BTC/USDT", "sma", "1m", ts, "buy", db_path=db_file, conn=conn) is True
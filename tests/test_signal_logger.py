@@ -272,3 +272,34 @@ def test_get_signals_db_error(monkeypatch, tmp_path):
 
     monkeypatch.setattr(sqlite3, "connect", bad_connect)
     assert get_signals_from_db(db_path=str(db)) == []
+
+
+def test_get_connection_is_shared_and_uses_wal(tmp_path):
+    db_path = str(tmp_path / "shared" / "signals.db")
+    try:
+        conn = signal_logger.get_connection(db_path)
+        assert signal_logger.get_connection(db_path) is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        signals = [{"timestamp": pd.Timestamp("2024-01-01"), "action": "buy", "price": 1}]
+        log_signals_to_db(signals, "BTC/USDT", db_path=db_path, conn=conn)
+        assert mark_signal_handled("BTC/USDT", "sma", "1m", "1", "buy", db_path=db_path, conn=conn) is False
+        assert mark_signal_handled("BTC/USDT", "sma", "1m", "1", "buy", db_path=db_path, conn=conn) is True
+        assert len(get_signals_from_db(db_path=db_path)) == 1
+    finally:
+        signal_logger.close_connections()
+
+
+def test_log_signals_batch(tmp_path):
+    db_path = str(tmp_path / "signals.db")
+    ts = pd.Timestamp("2024-01-01 10:00:00")
+    entries = [
+        ("BTC/USDT", [{"timestamp": ts, "action": "buy", "price": 1.0}]),
+        ("ETH/USDT", [{"timestamp": ts, "action": "sell", "price": 2.0}]),
+        ("SOL/USDT", []),
+    ]
+    signal_logger.log_signals_batch(entries, db_path=db_path)
+    signal_logger.log_signals_batch([], db_path=db_path)
+
+    rows = get_signals_from_db(db_path=db_path)
+    assert sorted(r[3] for r in rows) == ["BTC/USDT", "ETH/USDT"]
@@ -27,3 +27,21 @@ def test_missing_required_column_raises(strategy_name, df_constant_factory):
     df = df_constant_factory(20).drop(columns=["close"])
     with pytest.raises(KeyError):
         strategy(df)
+
+
+def test_signals_from_masks_targets_next_row_and_prefers_buy():
+    import numpy as np
+
+    from trading_bot.strategies.base import signals_from_masks
+
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=4, freq="1min"),
+            "close": [1, 2, 3, 4],
+        }
+    )
+    buy = np.array([True, False, True])
+    sell = np.array([False, True, True])
+    signals = signals_from_masks(df, buy, sell)
+    assert [(s["action"], s["price"]) for s in signals] == [("buy", 2.0), ("sell", 3.0), ("buy", 4.0)]
+    assert signals[0]["timestamp"] == df["timestamp"].iloc[1]
@@ -27,3 +27,42 @@ def test_plugin_discovery(tmp_path, monkeypatch):
         strategies.STRATEGY_REGISTRY.pop("dummy", None)
         monkeypatch.delenv("TRADING_BOT_PLUGIN_PATH", raising=False)
         importlib.reload(strategies)
+
+
+def test_fresh_import_does_not_reload_strategy_modules(monkeypatch):
+    """Only a reload of the package re-executes its strategy modules."""
+
+    import sys
+
+    reloaded = []
+    real_reload = importlib.reload
+
+    def tracking_reload(module):
+        reloaded.append(module.__name__)
+        return real_reload(module)
+
+    monkeypatch.setattr(importlib, "reload", tracking_reload)
+    import trading_bot
+
+    monkeypatch.setattr(trading_bot, "strategies", trading_bot.strategies)
+    saved = {
+        name: module
+        for name, module in sys.modules.items()
+        if name == "trading_bot.strategies"
+        or name.startswith("trading_bot.strategies.")
+    }
+    for name in saved:
+        monkeypatch.delitem(sys.modules, name)
+
+    try:
+        fresh = importlib.import_module("trading_bot.strategies")
+        assert reloaded == []
+        assert "sma" in fresh.STRATEGY_REGISTRY
+
+        importlib.reload(fresh)
+        assert "trading_bot.strategies.sma_strategy" in reloaded
+        assert "sma" in fresh.STRATEGY_REGISTRY
+    finally:
+        for name in [n for n in sys.modules if n.startswith("trading_bot.strategies")]:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved)
@@ -1,4 +1,7 @@
+import math
+
 import pandas as pd
+import pytest
 from trading_bot.tuner import tune
 
 
@@ -23,3 +26,67 @@ def test_tune_returns_sorted_results(tmp_path):
     assert isinstance(results, list) and results
     net_pnls = [r["net_pnl"] for r in results]
     assert net_pnls == sorted(net_pnls, reverse=True)
+
+
+def test_tune_loads_csv_once(tmp_path, monkeypatch):
+    from trading_bot import tuner
+    from trading_bot.backtester import load_csv_data
+
+    timestamps = pd.date_range("2024-01-01", periods=10, freq="1min")
+    df = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": [100] * 10,
+            "high": [101] * 10,
+            "low": [99] * 10,
+            "close": [100 + i for i in range(10)],
+            "volume": [1000] * 10,
+        }
+    )
+    csv_file = tmp_path / "data.csv"
+    df.to_csv(csv_file, index=False)
+
+    loads = []
+
+    def counting_load(path):
+        loads.append(path)
+        return load_csv_data(path)
+
+    monkeypatch.setattr(tuner, "load_csv_data", counting_load)
+    results = tune(str(csv_file), strategy="sma", param_grid={"sma_short": [2, 3], "sma_long": [5, 6]})
+
+    assert len(results) == 4
+    assert loads == [str(csv_file)]
+
+
+def test_tune_routes_simulation_params_like_run_backtest(tmp_path):
+    from trading_bot.backtester import run_backtest
+
+    timestamps = pd.date_range("2024-01-01", periods=60, freq="1min")
+    closes = [100 + 10 * math.sin(i / 4) for i in range(60)]
+    df = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": closes,
+            "high": [c + 1 for c in closes],
+            "low": [c - 1 for c in closes],
+            "close": closes,
+            "volume": [1000] * 60,
+        }
+    )
+    csv_file = tmp_path / "data.csv"
+    df.to_csv(csv_file, index=False)
+
+    grid = {"sma_short": [2], "sma_long": [5], "fees_bps": [0, 100], "trade_size": [1, 5]}
+    results = tune(str(csv_file), strategy="sma", param_grid=grid)
+
+    assert len(results) == 4
+    for res in results:
+        expected = run_backtest(str(csv_file), strategy="sma", **res["params"])
+        assert {k: res[k] for k in expected} == expected
+    assert len({res["net_pnl"] for res in results}) == 4
+
+
+def test_tune_unknown_strategy_without_grid_raises_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        tune(str(tmp_path / "missing.csv"), strategy="no-such-strategy")
@@ -34,3 +34,15 @@ def test_cli_trade_size_validation():
             parse_args()
     finally:
         sys.argv = original
+
+
+def test_cli_bounds_validation():
+    original = sys.argv
+    try:
+        sys.argv = ["main.py", "live", "--interval-seconds", "0"]
+        with pytest.raises(SystemExit):
+            parse_args()
+        sys.argv = ["main.py", "live", "--fee-bps", "0"]
+        assert parse_args().fee_bps == 0
+    finally:
+        sys.argv = original
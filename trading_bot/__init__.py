@@ -11,13 +11,23 @@ __version__ = "1.2.0"
 __author__ = "Trading Bot Team"
 __email__ = "trading-bot@example.com"
 
-from .data_fetch import fetch_market_data
-from .main import main as cli_main
-from .performance import compute_equity_curve
-from .portfolio import Portfolio, Position
-from .risk.config import RiskConfig, get_risk_config
-from .signal_logger import get_signals_from_db, log_signals_to_db
-from .strategy import sma_strategy
+import importlib
+from typing import Any
+
+# Public names are resolved on first access so that importing the package
+# (e.g. for the ``trading-bot`` console script) does not load pandas and ccxt.
+_LAZY_ATTRS = {
+    "cli_main": (".main", "main"),
+    "fetch_market_data": (".data_fetch", "fetch_market_data"),
+    "sma_strategy": (".strategy", "sma_strategy"),
+    "log_signals_to_db": (".signal_logger", "log_signals_to_db"),
+    "get_signals_from_db": (".signal_logger", "get_signals_from_db"),
+    "compute_equity_curve": (".performance", "compute_equity_curve"),
+    "get_risk_config": (".risk.config", "get_risk_config"),
+    "RiskConfig": (".risk.config", "RiskConfig"),
+    "Portfolio": (".portfolio", "Portfolio"),
+    "Position": (".portfolio", "Position"),
+}
 
 __all__ = [
     "cli_main",
@@ -31,3 +41,17 @@ __all__ = [
     "Portfolio",
     "Position",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Optional, Sequence
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
 
 
 import pandas as pd
@@ -22,6 +24,12 @@ DEFAULT_MAX_POSITION_PCT = CONFIG.get("max_position_pct", 1.0)
 
 REQUIRED_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
 
+# Signals from recent generate_signals calls keyed on the strategy function,
+# its parameters and a fingerprint of the candle data, so parameter sweeps
+# and repeated runs over the same data do not recompute them
+_SIGNAL_CACHE: "OrderedDict[Tuple[Any, ...], List[dict[str, Any]]]" = OrderedDict()
+_SIGNAL_CACHE_SIZE = 32
+
 
 def load_csv_data(csv_path: str) -> pd.DataFrame:
     """Load historical OHLCV data from a CSV file.
@@ -251,7 +259,43 @@ def generate_signals(
     if "required_count" in metadata and "required" not in strategy_kwargs:
         strategy_kwargs["required"] = metadata["required_count"]
 
-    return strategy_fn(df, **strategy_kwargs)
+    key = _signal_cache_key(df, strategy_fn, strategy_kwargs)
+    if key is None:
+        return strategy_fn(df, **strategy_kwargs)
+    cached = _SIGNAL_CACHE.get(key)
+    if cached is None:
+        cached = strategy_fn(df, **strategy_kwargs)
+        _SIGNAL_CACHE[key] = cached
+        if len(_SIGNAL_CACHE) > _SIGNAL_CACHE_SIZE:
+            _SIGNAL_CACHE.popitem(last=False)
+    else:
+        _SIGNAL_CACHE.move_to_end(key)
+    # Copies, so callers annotating the dicts do not alter the cached ones
+    return [dict(s) for s in cached]
+
+
+def _signal_cache_key(df, strategy_fn, strategy_kwargs: dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """Return a cache key for a strategy call, or ``None`` if it cannot be cached."""
+    params: List[Tuple[str, Hashable]] = []
+    for name, value in sorted(strategy_kwargs.items()):
+        if isinstance(value, list):
+            value = tuple(value)
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        params.append((name, value))
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    return (strategy_fn, tuple(params), tuple(df.columns), digest)
+
+
+def clear_signal_cache() -> None:
+    """Forget signals memoised by :func:`generate_signals`."""
+    _SIGNAL_CACHE.clear()
 
 
 def save_backtest_outputs(
@@ -267,7 +311,7 @@ def save_backtest_outputs(
     if equity_out:
         try:
             eq_df.to_csv(equity_out, index=False)
-            logger.info(f"Equity curve saved to {equity_out}")
+            logger.info("Equity curve saved to %s", equity_out)
         except OSError as e:  # pragma: no cover - I/O errors are uncommon
             logger.error("Failed to save equity curve to %s: %s", equity_out, e)
     else:
@@ -277,13 +321,13 @@ def save_backtest_outputs(
         try:
             with open(stats_out, "w") as f:
                 json.dump(stats, f, indent=2)
-            logger.info(f"Summary stats saved to {stats_out}")
+            logger.info("Summary stats saved to %s", stats_out)
         except OSError as e:  # pragma: no cover - I/O errors are uncommon
             logger.error("Failed to save summary stats to %s: %s", stats_out, e)
 
-    logger.info(f"Net PnL: {stats['net_pnl']:.2f}")
-    logger.info(f"Win rate: {stats['win_rate']:.2f}%")
-    logger.info(f"Max drawdown: {stats['max_drawdown']:.2f}%")
+    logger.info("Net PnL: %.2f", stats["net_pnl"])
+    logger.info("Win rate: %.2f%%", stats["win_rate"])
+    logger.info("Max drawdown: %.2f%%", stats["max_drawdown"])
 
     if plot and chart_out:
         import matplotlib
@@ -299,7 +343,7 @@ def save_backtest_outputs(
         plt.tight_layout()
         try:
             plt.savefig(chart_out)
-            logger.info(f"Equity chart saved to {chart_out}")
+            logger.info("Equity chart saved to %s", chart_out)
         except OSError as e:  # pragma: no cover - I/O errors are uncommon
             logger.error("Failed to save equity chart to %s: %s", chart_out, e)
 
@@ -148,7 +148,7 @@ class CcxtSpotBroker(Broker):
         for attempt in range(self.retries):
             try:
                 if self.dry_run:
-                    logger.info(f"[DRY-RUN] {order_payload}")
+                    logger.info("[DRY-RUN] %s", order_payload)
                     return order_payload
                 self._wait_rate_limit()
                 return self.exchange.create_order(symbol, type, side, qty)
@@ -2,7 +2,8 @@ import json
 import logging
 import os
 from functools import lru_cache
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from pydantic import (
     BaseModel,
@@ -27,6 +28,42 @@ def _deep_update(base: Dict, override: Dict) -> Dict:
     return base
 
 
+# Package root, where config.json and config.local.json live by default
+_DEFAULT_CONFIG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_DEFAULT_CONFIG: Dict = {
+    "symbol": "BTC/USDT",
+    "timeframe": "1m",
+    "limit": 500,
+    "sma_short": 5,
+    "sma_long": 20,
+    "rsi_period": 14,
+    "rsi_lower": 30,
+    "rsi_upper": 70,
+    "trade_size": 1.0,
+    "max_position_pct": 1.0,
+}
+
+# Environment variables that override values from the config files
+_ENV_OVERRIDES = (
+    ("TRADING_BOT_API_KEY", "api_key"),
+    ("TRADING_BOT_API_SECRET", "api_secret"),
+    ("TRADING_BOT_API_PASSPHRASE", "api_passphrase"),
+    ("TRADING_BOT_EXCHANGE", "exchange"),
+)
+
+_FileKey = Optional[Tuple[int, int]]
+
+
+def _file_key(path: str) -> _FileKey:
+    """Return ``(mtime_ns, size)`` for ``path`` or ``None`` if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_config(config_dir: Optional[str] = None) -> Dict:
     """Load configuration with optional local overrides.
 
@@ -40,8 +77,30 @@ def load_config(config_dir: Optional[str] = None) -> Dict:
     dict
         Merged configuration dictionary.
     """
-    base_dir = config_dir or os.path.join(os.path.dirname(os.path.dirname(__file__)))
+    base_dir = config_dir or _DEFAULT_CONFIG_DIR
     config_path = os.path.join(base_dir, "config.json")
+    local_path = os.path.join(base_dir, "config.local.json")
+    env = tuple(os.getenv(name) for name, _ in _ENV_OVERRIDES)
+    # Files are only re-read and re-validated once they change on disk
+    validated = _load_validated(
+        config_path,
+        _file_key(config_path),
+        local_path,
+        _file_key(local_path),
+        env,
+    )
+    return validated.model_dump()
+
+
+@lru_cache(maxsize=16)
+def _load_validated(
+    config_path: str,
+    config_key: _FileKey,
+    local_path: str,
+    local_key: _FileKey,
+    env: Tuple[Optional[str], ...],
+) -> "ConfigModel":
+    """Parse and validate the config files; cached on their mtime and size."""
     try:
         with open(config_path, "r") as f:
             config = json.load(f)
@@ -50,21 +109,9 @@ def load_config(config_dir: Optional[str] = None) -> Dict:
             "load_config: config.json not found at %s, using default values",
             config_path,
         )
-        config = {
-            "symbol": "BTC/USDT",
-            "timeframe": "1m",
-            "limit": 500,
-            "sma_short": 5,
-            "sma_long": 20,
-            "rsi_period": 14,
-            "rsi_lower": 30,
-            "rsi_upper": 70,
-            "trade_size": 1.0,
-            "max_position_pct": 1.0,
-        }
+        config = dict(_DEFAULT_CONFIG)
 
-    local_path = os.path.join(base_dir, "config.local.json")
-    if os.path.exists(local_path):
+    if local_key is not None:
         try:
             with open(local_path, "r") as f:
                 local_cfg = json.load(f)
@@ -76,24 +123,14 @@ def load_config(config_dir: Optional[str] = None) -> Dict:
                 e,
             )
     # Override sensitive values with environment variables if available
-    env_api_key = os.getenv("TRADING_BOT_API_KEY")
-    if env_api_key:
-        config["api_key"] = env_api_key
-    env_api_secret = os.getenv("TRADING_BOT_API_SECRET")
-    if env_api_secret:
-        config["api_secret"] = env_api_secret
-    env_api_passphrase = os.getenv("TRADING_BOT_API_PASSPHRASE")
-    if env_api_passphrase:
-        config["api_passphrase"] = env_api_passphrase
-    env_exchange = os.getenv("TRADING_BOT_EXCHANGE")
-    if env_exchange:
-        config["exchange"] = env_exchange
+    for (_, key), value in zip(_ENV_OVERRIDES, env):
+        if value:
+            config[key] = value
 
     try:
-        validated = ConfigModel(**config)
+        return ConfigModel(**config)
     except ValidationError as e:  # noqa: BLE001
         raise ValueError(f"Invalid configuration: {e}") from e
-    return validated.model_dump()
 
 
 class ConfluenceModel(BaseModel):
@@ -140,6 +177,10 @@ class ConfigModel(BaseModel):
 
 
 @lru_cache(maxsize=1)
-def get_config(config_dir: Optional[str] = None) -> Dict:
-    """Return the merged configuration, caching the result."""
-    return load_config(config_dir)
+def get_config(config_dir: Optional[str] = None) -> Mapping[str, Any]:
+    """Return the merged configuration, caching the result.
+
+    The cached mapping is shared by every caller and is therefore read-only;
+    use :func:`load_config` for a private, mutable copy.
+    """
+    return MappingProxyType(load_config(config_dir))
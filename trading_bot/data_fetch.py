@@ -1,5 +1,7 @@
 import logging
-from typing import Optional
+import threading
+import weakref
+from typing import Any, Dict, Optional
 
 import pandas as pd
 import ccxt
@@ -10,6 +12,47 @@ from trading_bot.utils.retry import RetryPolicy, default_retry
 
 logger = logging.getLogger(__name__)
 
+# Credential-less clients keyed by exchange name. Reusing them keeps the
+# loaded markets and HTTP session across calls that do not pass ``exchange``.
+_SHARED_EXCHANGES: Dict[Optional[str], Any] = {}
+_SHARED_EXCHANGES_LOCK = threading.Lock()
+
+# One lock per client. ccxt's synchronous clients are not safe for
+# concurrent use: their HTTP session and rate limiter, which spaces requests
+# from ``lastRestRequestTimestamp``, assume one request at a time. Clients
+# are shared across threads, e.g. the shared clients above or the
+# dashboard's module-level client under Streamlit's per-session threads, so
+# requests through a client are serialised here and keep ccxt's spacing.
+_CLIENT_LOCKS: "weakref.WeakKeyDictionary[Any, threading.Lock]" = weakref.WeakKeyDictionary()
+_CLIENT_LOCKS_LOCK = threading.Lock()
+
+
+def _shared_exchange(exchange_name: Optional[str]) -> Any:
+    with _SHARED_EXCHANGES_LOCK:
+        exchange = _SHARED_EXCHANGES.get(exchange_name)
+        if exchange is None:
+            if exchange_name:
+                exchange = create_exchange(exchange_name=exchange_name)
+            else:
+                exchange = create_exchange()
+            _SHARED_EXCHANGES[exchange_name] = exchange
+        return exchange
+
+
+def _client_lock(exchange: Any) -> threading.Lock:
+    with _CLIENT_LOCKS_LOCK:
+        lock = _CLIENT_LOCKS.get(exchange)
+        if lock is None:
+            lock = threading.Lock()
+            _CLIENT_LOCKS[exchange] = lock
+        return lock
+
+
+def _fetch_ohlcv(exchange: Any, symbol: str, timeframe: str, limit: int) -> Any:
+    # Only the request holds the lock; retry backoff sleeps outside it
+    with _client_lock(exchange):
+        return exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+
 
 def fetch_market_data(
     symbol: str = "BTC/USDT",
@@ -28,7 +71,8 @@ def fetch_market_data(
         timeframe (str): Timeframe for candles (e.g., 1m, 5m)
         limit (int): Number of candles to fetch
         exchange (ccxt.Exchange, optional): Pre-instantiated exchange client
-        exchange_name (str, optional): Exchange name string to instantiate dynamically
+        exchange_name (str, optional): Exchange name string to instantiate dynamically;
+            without credentials the client is created once and reused
         retry_policy (RetryPolicy, optional): Policy controlling retries
         creds (dict): Optional credentials
 
@@ -37,21 +81,21 @@ def fetch_market_data(
     """
     try:
         if exchange is None:
-            if exchange_name:
+            if not creds:
+                exchange = _shared_exchange(exchange_name)
+            elif exchange_name:
                 exchange = create_exchange(**creds, exchange_name=exchange_name)
-            elif creds:
-                exchange = create_exchange(**creds)
             else:
-                exchange = create_exchange()
+                exchange = create_exchange(**creds)
         policy = retry_policy or default_retry()
-        ohlcv = policy.call(exchange.fetch_ohlcv, symbol, timeframe, limit=limit)
+        ohlcv = policy.call(_fetch_ohlcv, exchange, symbol, timeframe, limit)
 
         df = pd.DataFrame(ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
         df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
 
-        logger.info(f"Successfully fetched {len(df)} candles for {symbol} from {exchange.id}")
+        logger.info("Successfully fetched %d candles for %s from %s", len(df), symbol, exchange.id)
         return df
 
     except (ccxt.BaseError, RuntimeError) as e:
-        logger.error(f"Error fetching data: {e}")
+        logger.error("Error fetching data: %s", e)
         raise
@@ -1,38 +1,43 @@
 import argparse
+import atexit
 import json
 import logging
+import operator
 import os
+import queue
 import signal as sig
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from importlib.metadata import PackageNotFoundError, version
-from typing import Any, Dict, List, Optional, Sequence
+from functools import lru_cache, partial
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from ccxt.base.exchange import Exchange
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
-
-from trading_bot.backtester import run_backtest
-from trading_bot.broker import CcxtSpotBroker, PaperBroker
-from trading_bot.data_fetch import fetch_market_data
-from trading_bot.exchange import create_exchange, execute_trade
 from trading_bot.notify import configure as configure_alerts
 from trading_bot.portfolio import Portfolio
 from trading_bot.risk.exits import ExitManager
+from trading_bot.risk.guardrails import Guardrails
 from trading_bot.risk.position_sizing import calculate_position_size
 from trading_bot.risk.config import get_risk_config
 from trading_bot.signal_logger import (
+    get_connection,
+    log_signals_batch,
     log_signals_to_db,
     log_trade_to_db,
     mark_signal_handled,
 )
-from trading_bot.strategies import STRATEGY_REGISTRY
 from trading_bot.config import get_config
 from trading_bot.utils.logging_config import setup_logging
 from trading_bot.utils.retry import RetryPolicy, default_retry
 from trading_bot.utils.state import default_state_dir
 from trading_bot import metrics
 
+if TYPE_CHECKING:
+    from ccxt.base.exchange import Exchange
+
+    from trading_bot.strategies import Strategy
+
 CONFIG = get_config()
 DEFAULT_RSI_PERIOD = CONFIG.get("rsi_period", 14)
 DEFAULT_RSI_LOWER = CONFIG.get("rsi_lower", 30)
@@ -40,197 +45,266 @@ DEFAULT_RSI_UPPER = CONFIG.get("rsi_upper", 70)
 DEFAULT_BBANDS_STD = CONFIG.get("bbands_std", 2)
 MAX_POSITION_PCT = CONFIG.get("max_position_pct", 1.0)
 
-try:
-    from plyer import notification
-except ImportError:  # pragma: no cover - plyer is optional
-    notification = None  # ensure attribute exists for tests
+# plyer is imported on the first alert rather than at startup; ``None`` means
+# "not loaded yet" and ``False`` means "unavailable".
+notification: Any = None
 
 logger = logging.getLogger(__name__)
 
+# Desktop notifications are delivered by a background worker so a slow
+# notification backend never stalls the trading loop.
+_ALERT_QUEUE: "queue.Queue[Dict[str, str]]" = queue.Queue(maxsize=64)
+# Signals listed in a single batched desktop notification
+_MAX_ALERT_LINES = 5
+_ALERT_THREAD: Optional[threading.Thread] = None
+_ALERT_THREAD_LOCK = threading.Lock()
 
-class CLIArgsModel(BaseModel):
-    # Python 3.9–3.12 compatible typing
-    limit: Optional[int] = Field(default=None, gt=0)
-    trade_size: Optional[float] = Field(default=None, gt=0)
-    fee_bps: Optional[float] = Field(default=None, ge=0)
-    interval_seconds: int = Field(default=60, gt=0)
+# Resolved ``<state_dir>/logs`` paths that are known to exist
+_LOG_DIR_CACHE: Dict[str, str] = {}
 
-    model_config = ConfigDict(extra="ignore")
+# Append handles for the order and signal logs, keyed by path and kept open
+# until the file rotates or the process exits
+_LOG_HANDLES: Dict[str, IO[str]] = {}
+_LOG_HANDLES_LOCK = threading.Lock()
 
+# Candles per (symbol, timeframe, limit), reused until a newer candle opens
+_CANDLE_CACHE: Dict[Tuple[str, str, int], Any] = {}
+# Candle frame and bound strategy last analysed per (symbol, timeframe,
+# limit); analysing the same pair again would only repeat its signals
+_ANALYSED_CANDLES: Dict[Tuple[str, str, int], Tuple[Any, Callable[..., Any]]] = {}
 
-def parse_args():
-    """Parse command line arguments with explicit subcommands."""
-    parser = argparse.ArgumentParser(
-        description=(
-            "Crypto Trading Bot. Defaults come from config.json, overridden by "
-            "config.local.json and finally by CLI flags."
-        )
-    )
+# Live mode only acts on the most recent signals of each analysis window
+_LIVE_SIGNAL_TAIL = 3
 
-    # version option is global
-    try:
-        pkg_version = version("trading-bot")
-    except PackageNotFoundError:
+# Unpacks the fields written to the signal log in one C-level call per signal
+_SIGNAL_FIELDS = operator.itemgetter("timestamp", "action", "price")
+
+
+# Unknown CLI options with this prefix are risk config overrides
+_RISK_PREFIX = "--risk."
+_RISK_PREFIX_LEN = len(_RISK_PREFIX)
+
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# (attribute, bound, inclusive) lower bounds enforced on numeric CLI options
+_CLI_LOWER_BOUNDS = (
+    ("limit", 0, False),
+    ("trade_size", 0.0, False),
+    ("fee_bps", 0.0, True),
+    ("interval_seconds", 0, False),
+)
+
+
+class _VersionAction(argparse.Action):
+    """``--version`` that resolves the installed package version only when used."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
         try:
-            from trading_bot import __version__ as pkg_version
-        except Exception:
-            pkg_version = "0.0.0"
-    parser.add_argument("--version", action="version", version=f"%(prog)s {pkg_version}")
+            pkg_version = version("trading-bot")
+        except PackageNotFoundError:
+            try:
+                from trading_bot import __version__ as pkg_version
+            except Exception:
+                pkg_version = "0.0.0"
+        sys.stdout.write(f"{parser.prog} {pkg_version}\n")
+        parser.exit()
+
+
+def _sniff_command(argv: Sequence[str]) -> Optional[str]:
+    """Return the subcommand token in ``argv``, if any.
+
+    The top-level parser only takes flags without values, so the first
+    positional token is the subcommand.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token
+    return None
 
-    # Common options shared across subcommands
-    common = argparse.ArgumentParser(add_help=False)
-    common.add_argument(
+
+def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register options shared by the live, backtest and optimize subcommands."""
+    parser.add_argument(
         "--exchange",
         type=str,
         default=None,
         help="Specify exchange to use (e.g., binance, coinbase, kraken). Overrides config files.",
     )
-    common.add_argument(
+    parser.add_argument(
         "--symbol",
         type=str,
         help="Trading pair symbol (e.g., BTC/USDT). Overrides config files.",
     )
-    common.add_argument(
+    parser.add_argument(
         "--timeframe",
         type=str,
         help="Timeframe for candles (e.g., 1m, 5m). Overrides config files.",
     )
-    common.add_argument("--limit", type=int, help="Number of candles to fetch. Overrides config files.")
-    common.add_argument("--sma-short", type=int, help="Short-period SMA window. Overrides config files.")
-    common.add_argument("--sma-long", type=int, help="Long-period SMA window. Overrides config files.")
-    common.add_argument(
+    parser.add_argument("--limit", type=int, help="Number of candles to fetch. Overrides config files.")
+    parser.add_argument("--sma-short", type=int, help="Short-period SMA window. Overrides config files.")
+    parser.add_argument("--sma-long", type=int, help="Long-period SMA window. Overrides config files.")
+    parser.add_argument(
         "--live-trade",
         action="store_true",
         help="Execute real orders when in live mode",
     )
-    common.add_argument("--dry-run", action="store_true", help="Print order payload without executing")
-    common.add_argument("--api-key", type=str, help="Exchange API key")
-    common.add_argument("--api-secret", type=str, help="Exchange API secret")
-    common.add_argument("--api-passphrase", type=str, help="Exchange API passphrase (if required)")
-    common.add_argument("--broker", type=str, help="Broker type to use (paper or ccxt)")
-    common.add_argument("--strategy", type=str, default="sma", help="Trading strategy to use")
-    common.add_argument(
+    parser.add_argument("--dry-run", action="store_true", help="Print order payload without executing")
+    parser.add_argument("--api-key", type=str, help="Exchange API key")
+    parser.add_argument("--api-secret", type=str, help="Exchange API secret")
+    parser.add_argument("--api-passphrase", type=str, help="Exchange API passphrase (if required)")
+    parser.add_argument("--broker", type=str, help="Broker type to use (paper or ccxt)")
+    parser.add_argument("--strategy", type=str, default="sma", help="Trading strategy to use")
+    parser.add_argument(
         "--list-strategies",
         action="store_true",
         help="List available strategies and exit",
     )
-    common.add_argument(
+    parser.add_argument(
         "--alert-mode",
         action="store_true",
         help="Enable alert notifications for BUY/SELL signals",
     )
-    common.add_argument(
+    parser.add_argument(
         "--metrics-port",
         type=int,
         default=None,
         help="Expose Prometheus metrics on this port",
     )
-    common.add_argument(
+    parser.add_argument(
         "--health-port",
         type=int,
         default=None,
         help="Expose simple HTTP health check on this port",
     )
-    common.add_argument(
+    parser.add_argument(
         "--trade-size",
         type=float,
         default=None,
         help="Default trade size in asset units. Overrides config files.",
     )
-    common.add_argument(
+    parser.add_argument(
         "--fee-bps",
         type=float,
         default=None,
         help="Trading fee in basis points. Overrides config files.",
     )
-    common.add_argument(
+    parser.add_argument(
         "--stop-loss-pct",
         type=float,
         default=None,
         help="Decimal percentage drop from entry to trigger a stop-loss (e.g. 0.02).",
     )
-    common.add_argument(
+    parser.add_argument(
         "--take-profit-pct",
         type=float,
         default=None,
         help="Decimal percentage gain from entry to take profit (e.g. 0.05).",
     )
-    common.add_argument(
+    parser.add_argument(
         "--position-sizing",
         type=str,
         choices=["fixed_fraction", "fixed_cash"],
         help="Position sizing mode. Overrides config files.",
     )
-    common.add_argument(
+    parser.add_argument(
         "--fixed-fraction",
         type=float,
         help="Fraction of equity to use per trade. Overrides config files.",
     )
-    common.add_argument(
+    parser.add_argument(
         "--fixed-cash",
         type=float,
         help="Fixed cash amount to use per trade. Overrides config files.",
     )
     # keep interval-seconds on the shared "common" parser (resolved merge conflict)
-    common.add_argument(
+    parser.add_argument(
         "--interval-seconds",
         type=int,
         default=60,
         help="Polling interval for live mode in seconds",
     )
-    common.add_argument(
+    parser.add_argument(
         "--symbols",
         type=str,
         help="Comma-separated list of trading symbols for live mode",
     )
-    common.add_argument("--risk-profile", type=str, help="Risk profile name. Overrides config files.")
-    common.add_argument("--state-dir", type=str, help="Directory for logs and database state")
-    common.add_argument(
+    parser.add_argument("--risk-profile", type=str, help="Risk profile name. Overrides config files.")
+    parser.add_argument("--state-dir", type=str, help="Directory for logs and database state")
+    parser.add_argument(
         "--log-level",
         type=str.upper,
         default="INFO",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=_LOG_LEVELS,
         help="Logging level for the application",
     )
-    common.add_argument("--json-logs", action="store_true", help="Output logs in JSON format")
+    parser.add_argument("--json-logs", action="store_true", help="Output logs in JSON format")
+
+
+@lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """Build the CLI parser with options for ``command`` only.
+
+    Parsers are cached per subcommand, so repeated ``parse_args`` calls in one
+    process (tests, tuning drivers) reuse the same Action objects.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Crypto Trading Bot. Defaults come from config.json, overridden by "
+            "config.local.json and finally by CLI flags."
+        )
+    )
 
+    # version option is global
+    parser.add_argument("--version", action=_VersionAction, help="show program's version number and exit")
+
+    # Every subcommand is registered so it shows up in --help, but only the
+    # one being invoked has its options built.
     subparsers = parser.add_subparsers(dest="command")
 
     # live trading subcommand
-    subparsers.add_parser("live", parents=[common], help="Run live trading")
+    live_parser = subparsers.add_parser("live", help="Run live trading")
+    if command == "live":
+        _add_common_arguments(live_parser)
 
     # backtest subcommand
-    backtest_parser = subparsers.add_parser("backtest", parents=[common], help="Run a backtest on historical data")
-    backtest_parser.add_argument("--file", required=True, help="Path to CSV file for historical backtesting")
-    backtest_parser.add_argument(
-        "--save-chart",
-        action="store_true",
-        help="Save equity curve CSV/JSON and chart during backtest",
-    )
+    backtest_parser = subparsers.add_parser("backtest", help="Run a backtest on historical data")
+    if command == "backtest":
+        _add_common_arguments(backtest_parser)
+        backtest_parser.add_argument("--file", required=True, help="Path to CSV file for historical backtesting")
+        backtest_parser.add_argument(
+            "--save-chart",
+            action="store_true",
+            help="Save equity curve CSV/JSON and chart during backtest",
+        )
 
     # optimization subcommand
-    opt_parser = subparsers.add_parser("optimize", parents=[common], help="Run parameter tuning or walk-forward")
-    opt_parser.add_argument("--file", required=True, help="Path to CSV file for historical backtesting")
-    opt_parser.add_argument(
-        "--tune",
-        action="store_true",
-        help="Run parameter tuning over a range of values",
-    )
-    opt_parser.add_argument(
-        "--walk-forward",
-        action="store_true",
-        help="Run walk-forward optimization over rolling windows",
-    )
-    opt_parser.add_argument(
-        "--train-size",
-        type=int,
-        help="Training window size for walk-forward optimization",
-    )
-    opt_parser.add_argument(
-        "--test-size",
-        type=int,
-        help="Testing window size for walk-forward optimization",
-    )
+    opt_parser = subparsers.add_parser("optimize", help="Run parameter tuning or walk-forward")
+    if command == "optimize":
+        _add_common_arguments(opt_parser)
+        opt_parser.add_argument("--file", required=True, help="Path to CSV file for historical backtesting")
+        opt_parser.add_argument(
+            "--tune",
+            action="store_true",
+            help="Run parameter tuning over a range of values",
+        )
+        opt_parser.add_argument(
+            "--walk-forward",
+            action="store_true",
+            help="Run walk-forward optimization over rolling windows",
+        )
+        opt_parser.add_argument(
+            "--train-size",
+            type=int,
+            help="Training window size for walk-forward optimization",
+        )
+        opt_parser.add_argument(
+            "--test-size",
+            type=int,
+            help="Testing window size for walk-forward optimization",
+        )
 
     # Simulation matrix subcommand
     simulate_parser = subparsers.add_parser(
@@ -238,40 +312,58 @@ def parse_args():
         help="Run simulation matrix across strategies, timeframes, and position sizes",
         description="Run comprehensive simulation matrix for performance analysis",
     )
-    simulate_parser.add_argument(
-        "--strategies",
-        type=str,
-        nargs="*",
-        help="Strategies to test (default: auto-discover from registry)",
-    )
-    simulate_parser.add_argument(
-        "--timeframes",
-        type=str,
-        nargs="*",
-        default=["5m", "1h"],
-        help="Timeframes to test (default: 5m, 1h)",
-    )
-    simulate_parser.add_argument(
-        "--position-sizes",
-        type=float,
-        nargs="*",
-        default=[0.02, 0.05, 0.10],
-        help="Position sizes as decimal (default: 0.02, 0.05, 0.10)",
-    )
+    if command == "simulate":
+        simulate_parser.add_argument(
+            "--strategies",
+            type=str,
+            nargs="*",
+            help="Strategies to test (default: auto-discover from registry)",
+        )
+        simulate_parser.add_argument(
+            "--timeframes",
+            type=str,
+            nargs="*",
+            default=["5m", "1h"],
+            help="Timeframes to test (default: 5m, 1h)",
+        )
+        simulate_parser.add_argument(
+            "--position-sizes",
+            type=float,
+            nargs="*",
+            default=[0.02, 0.05, 0.10],
+            help="Position sizes as decimal (default: 0.02, 0.05, 0.10)",
+        )
+
+    return parser
 
+
+def parse_args():
+    """Parse command line arguments with explicit subcommands."""
+    parser = _build_parser(_sniff_command(sys.argv[1:]))
     args, unknown = parser.parse_known_args()
     if not getattr(args, "command", None):
         parser.error("a subcommand is required")
 
+    # Accept both ``--risk.key value`` and ``--risk.key=value`` in one pass;
+    # anything else argparse did not recognise is an error.
     risk_overrides: Dict[str, Any] = {}
-    it = iter(unknown)
-    for token in it:
-        if token.startswith("--risk."):
-            key = token[2 + len("risk.") :]
-            value = next(it, None)
-            if value is None:
+    unrecognized: List[str] = []
+    i, n = 0, len(unknown)
+    while i < n:
+        token = unknown[i]
+        i += 1
+        if token[:_RISK_PREFIX_LEN] != _RISK_PREFIX:
+            unrecognized.append(token)
+            continue
+        key, sep, value = token[_RISK_PREFIX_LEN:].partition("=")
+        if not sep:
+            if i >= n:
                 raise SystemExit(f"Missing value for {token}")
-            risk_overrides[key] = value
+            value = unknown[i]
+            i += 1
+        risk_overrides[key] = value
+    if unrecognized:
+        parser.error(f"unrecognized arguments: {' '.join(unrecognized)}")
     if getattr(args, "position_sizing", None):
         risk_overrides["position_sizing.mode"] = args.position_sizing
     if getattr(args, "fixed_fraction", None) is not None:
@@ -305,71 +397,183 @@ def parse_args():
         setattr(args, "live", False)
         setattr(args, "backtest", None)
 
-    try:
-        CLIArgsModel(**vars(args))
-    except ValidationError as e:
-        parser.error(str(e))
+    for name, bound, inclusive in _CLI_LOWER_BOUNDS:
+        value = getattr(args, name, None)
+        if value is not None and (value < bound or (value == bound and not inclusive)):
+            parser.error(f"{name} must be {'>=' if inclusive else '>'} {bound}")
     return args
 
 
+def _ensure_logs_dir(state_dir: Optional[str] = None) -> str:
+    """Return ``<state_dir>/logs``, creating it only the first time it is seen."""
+    state_dir = state_dir or default_state_dir()
+    logs_dir = _LOG_DIR_CACHE.get(state_dir)
+    if logs_dir is None:
+        logs_dir = os.path.join(state_dir, "logs")
+        os.makedirs(logs_dir, exist_ok=True)
+        _LOG_DIR_CACHE[state_dir] = logs_dir
+    return logs_dir
+
+
+def _append_to_log(log_path: str, text: str, rotate_suffix: Optional[str] = None) -> None:
+    """Append ``text`` to ``log_path`` through a cached handle and flush it.
+
+    When ``rotate_suffix`` is given, any other open handle in the same
+    directory whose name ends with it is closed first, so only the current
+    day's file stays open.
+    """
+    with _LOG_HANDLES_LOCK:
+        f = _LOG_HANDLES.get(log_path)
+        if f is None:
+            if rotate_suffix:
+                logs_dir = os.path.dirname(log_path)
+                for path in [p for p in _LOG_HANDLES if p.endswith(rotate_suffix)]:
+                    if os.path.dirname(path) == logs_dir:
+                        _LOG_HANDLES.pop(path).close()
+            f = open(log_path, "a", encoding="utf-8")
+            _LOG_HANDLES[log_path] = f
+        f.write(text)
+        f.flush()
+
+
 def log_signals_to_file(
     signals: List[Dict[str, Any]],
     symbol: str,
     state_dir: Optional[str] = None,
-) -> None:
+) -> bool:
+    """Append ``signals`` to the daily signal log; return whether they were written."""
     if not signals:
-        return None
-    state_dir = state_dir or default_state_dir()
-    logs_dir = os.path.join(state_dir, "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    log_path = os.path.join(logs_dir, f"{timestamp}_signals.log")
+        return False
+    logs_dir = _ensure_logs_dir(state_dir)
+    now = datetime.now(timezone.utc)
+    log_path = os.path.join(logs_dir, f"{now:%Y%m%d}_signals.log")
+    lines = [
+        f"Trading Signals Log - {symbol}\n",
+        f"Generated at: {now.isoformat()}\n",
+        "=" * 50 + "\n",
+    ]
+    lines.extend(
+        f"{ts.isoformat()} | {action.upper()} | {symbol} | ${price:.2f}\n"
+        for ts, action, price in map(_SIGNAL_FIELDS, signals)
+    )
     try:
-        with open(log_path, "w", encoding="utf-8") as f:
-            f.write(f"Trading Signals Log - {symbol}\n")
-            f.write(f"Generated at: {datetime.now(timezone.utc).isoformat()}\n")
-            f.write("=" * 50 + "\n")
-            for signal in signals:
-                ts = signal["timestamp"].isoformat()
-                f.write(f"{ts} | {signal['action'].upper()} | {symbol} | ${signal['price']:.2f}\n")
+        _append_to_log(log_path, "".join(lines), rotate_suffix="_signals.log")
         logger.info("Logged %d signals to %s", len(signals), log_path)
+        return True
     except OSError as e:
         logger.error("Failed to log signals to %s: %s", log_path, e)
+        return False
+
+
+def _unlogged_signals(signals: List[Dict[str, Any]], symbol: str, last_logged: Any) -> List[Dict[str, Any]]:
+    """Return the signals newer than ``last_logged``, the newest one already written."""
+    if last_logged is None:
+        return signals
+    try:
+        return [s for s in signals if s["timestamp"] > last_logged]
+    except TypeError:
+        logger.warning(
+            "Cannot compare signal timestamps for %s with the last logged one; logging all %d signals",
+            symbol,
+            len(signals),
+        )
+        return signals
 
 
 def log_order_to_file(
-    order: Dict[str, Any],
+    order: Optional[Dict[str, Any]],
     symbol: str,
     state_dir: Optional[str] = None,
 ) -> None:
     if not order:
         return
-    state_dir = state_dir or default_state_dir()
-    logs_dir = os.path.join(state_dir, "logs")
-    os.makedirs(logs_dir, exist_ok=True)
+    logs_dir = _ensure_logs_dir(state_dir)
     log_path = os.path.join(logs_dir, "orders.log")
+    ts = datetime.now(timezone.utc).isoformat()
+    order_id = order.get("id", "N/A")
+    amount = order.get("amount")
+    price = order.get("price")
+    side = order.get("side")
+    line = f"{ts} | {order_id} | {side} | {symbol} | {amount} @ {price}\n"
     try:
-        with open(log_path, "a", encoding="utf-8") as f:
-            ts = datetime.now(timezone.utc).isoformat()
-            order_id = order.get("id", "N/A")
-            amount = order.get("amount")
-            price = order.get("price")
-            side = order.get("side")
-            f.write(f"{ts} | {order_id} | {side} | {symbol} | {amount} @ {price}\n")
+        _append_to_log(log_path, line)
         logger.info("Logged order %s to %s", order.get("id", "N/A"), log_path)
     except OSError as e:
         logger.error("Failed to log order to %s: %s", log_path, e)
 
 
-def send_alert(signal):
-    ts = signal["timestamp"].isoformat()
-    message = f"ALERT: {signal['action'].upper()} at {ts} price ${signal['price']:.2f}"
-    logger.info(message)
-    if notification:
+@atexit.register
+def _close_log_handles() -> None:
+    with _LOG_HANDLES_LOCK:
+        for f in _LOG_HANDLES.values():
+            f.close()
+        _LOG_HANDLES.clear()
+
+
+def _alert_worker() -> None:
+    while True:
+        payload = _ALERT_QUEUE.get()
         try:
-            notification.notify(title="Trading Bot Alert", message=message)
+            if notification:
+                notification.notify(**payload)
         except Exception as e:
             logger.exception("send_alert: Notification error: %s", e)
+        finally:
+            _ALERT_QUEUE.task_done()
+
+
+def _ensure_alert_worker() -> None:
+    global _ALERT_THREAD
+    with _ALERT_THREAD_LOCK:
+        if _ALERT_THREAD is None:
+            _ALERT_THREAD = threading.Thread(target=_alert_worker, name="alert-notifier", daemon=True)
+            _ALERT_THREAD.start()
+
+
+def _load_notification() -> Any:
+    global notification
+    if notification is None:
+        try:
+            from plyer import notification as _notification
+        except ImportError:  # pragma: no cover - plyer is optional
+            notification = False
+        else:
+            notification = _notification
+    return notification
+
+
+def _alert_message(signal: Dict[str, Any]) -> str:
+    ts, action, price = _SIGNAL_FIELDS(signal)
+    return f"ALERT: {action.upper()} at {ts.isoformat()} price ${price:.2f}"
+
+
+def _queue_notification(message: str) -> None:
+    if _load_notification():
+        _ensure_alert_worker()
+        try:
+            _ALERT_QUEUE.put_nowait({"title": "Trading Bot Alert", "message": message})
+        except queue.Full:
+            logger.warning("send_alert: Notification queue full, dropping alert")
+
+
+def send_alert(signal):
+    message = _alert_message(signal)
+    logger.info(message)
+    _queue_notification(message)
+
+
+def send_alerts(signals: Sequence[Dict[str, Any]]) -> None:
+    """Log an alert for each signal and raise one desktop notification.
+
+    The notification lists the most recent :data:`_MAX_ALERT_LINES` signals
+    so a batch does not produce a burst of separate popups.
+    """
+    if not signals:
+        return
+    messages = [_alert_message(s) for s in signals]
+    for message in messages:
+        logger.info(message)
+    _queue_notification("\n".join(messages[-_MAX_ALERT_LINES:]))
 
 
 def signal_handler(signum, frame):  # noqa: ARG001 (frame unused)
@@ -378,6 +582,121 @@ def signal_handler(signum, frame):  # noqa: ARG001 (frame unused)
     sys.exit(0)
 
 
+# ccxt, pandas and the strategy modules are imported on first use so that
+# ``--help``, ``--version`` and argument errors do not pay for them.
+@lru_cache(maxsize=1)
+def _get_registry() -> Dict[str, "Strategy"]:
+    from trading_bot.strategies import STRATEGY_REGISTRY
+
+    return STRATEGY_REGISTRY
+
+
+def fetch_market_data(*args: Any, **kwargs: Any) -> Any:
+    from trading_bot.data_fetch import fetch_market_data as _fetch_market_data
+
+    return _fetch_market_data(*args, **kwargs)
+
+
+def _fetch_candles(
+    symbol: str,
+    timeframe: str,
+    limit: int,
+    exchange: Optional["Exchange"] = None,
+) -> Any:
+    """Return cached candles for ``symbol`` while its newest candle is still open.
+
+    Polling faster than the timeframe would otherwise refetch the same
+    candles; a new request is only made once the next candle has started.
+    That request only covers the candles since the cached one that was still
+    open, which are merged onto the cached window. The full window is
+    refetched when too many candles were missed or the new ones do not
+    overlap the cache.
+    """
+    from ccxt.base.exchange import Exchange
+
+    key = (symbol, timeframe, limit)
+    cached = _CANDLE_CACHE.get(key)
+    data = None
+    if cached is not None and len(cached):
+        period = Exchange.parse_timeframe(timeframe)
+        last_open = cached["timestamp"].iloc[-1].timestamp()
+        now = time.time()
+        if now < last_open + period:
+            return cached
+        # The last cached candle was still forming, so refetch it as well
+        missing = int((now - last_open) // period) + 1
+        if missing < limit:
+            data = _merge_candles(cached, _fetch_window(symbol, timeframe, missing, exchange), limit)
+    if data is None:
+        data = _fetch_window(symbol, timeframe, limit, exchange)
+    _CANDLE_CACHE[key] = data
+    return data
+
+
+def _fetch_window(symbol: str, timeframe: str, limit: int, exchange: Optional["Exchange"]) -> Any:
+    if exchange:
+        return fetch_market_data(symbol, timeframe, limit, exchange=exchange)
+    return fetch_market_data(symbol, timeframe, limit)
+
+
+def _merge_candles(cached: Any, recent: Any, limit: int) -> Any:
+    """Overlay ``recent`` candles onto ``cached``, or ``None`` if they leave a gap."""
+    import pandas as pd
+
+    if recent is None or not len(recent):
+        return None
+    first_new = recent["timestamp"].iloc[0]
+    if first_new > cached["timestamp"].iloc[-1]:
+        return None
+    older = cached[cached["timestamp"] < first_new]
+    return pd.concat([older, recent], ignore_index=True).tail(limit).reset_index(drop=True)
+
+
+def _bind_strategy(
+    strategy: str,
+    sma_short: int,
+    sma_long: int,
+    confluence_members: Optional[Sequence[str]] = None,
+    confluence_required: Optional[int] = None,
+    entry: Optional["Strategy"] = None,
+) -> Callable[[Any], List[Dict[str, Any]]]:
+    """Return ``strategy`` bound to its parameters as a one-argument callable.
+
+    The result only needs the candle ``DataFrame``, so callers that run the
+    same strategy repeatedly can resolve the registry entry and parameters
+    once.
+    """
+    if entry is None:
+        entry = _get_registry().get(strategy)
+        if entry is None:
+            raise ValueError("Unknown strategy. Use --list-strategies to view options.")
+    strategy_fn = entry.func
+
+    if strategy == "rsi":
+        return partial(
+            strategy_fn,
+            period=DEFAULT_RSI_PERIOD,
+            lower_thresh=DEFAULT_RSI_LOWER,
+            upper_thresh=DEFAULT_RSI_UPPER,
+        )
+    if strategy == "macd":
+        return strategy_fn
+    if strategy == "bbands":
+        return partial(strategy_fn, window=sma_long, num_std=DEFAULT_BBANDS_STD)
+    if strategy == "confluence":
+        if confluence_members is None:
+            confluence_members = entry.metadata.get("requires")
+        if confluence_required is None:
+            confluence_required = entry.metadata.get("required_count")
+        return partial(strategy_fn, members=confluence_members, required=confluence_required)
+
+    # SMA, EMA, etc. that accept two windows positionally
+    def windowed(df: Any) -> List[Dict[str, Any]]:
+        return strategy_fn(df, sma_short, sma_long)
+
+    return windowed
+
+
 def run_single_analysis(
     symbol: str,
     timeframe: str,
@@ -386,76 +705,132 @@ def run_single_analysis(
     sma_long: int,
     strategy: str = "sma",
     alert_mode: bool = False,
-    exchange: Optional[Exchange] = None,
+    exchange: Optional["Exchange"] = None,
     confluence_members: Optional[Sequence[str]] = None,
     confluence_required: Optional[int] = None,
     state_dir: Optional[str] = None,
+    log_to_db: bool = True,
+    cache_candles: bool = False,
+    strategy_call: Optional[Callable[[Any], List[Dict[str, Any]]]] = None,
+    logged_through: Optional[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
+    """Fetch data for ``symbol``, run ``strategy`` and log the resulting signals.
+
+    With ``log_to_db=False`` the caller is responsible for writing the signals
+    to the database, e.g. in one batch per live iteration. ``cache_candles``
+    reuses the previous fetch until a new candle opens (see
+    :func:`_fetch_candles`); until then the strategy is not run again and an
+    empty list is returned, since every signal in the window was already
+    returned, logged and alerted by an earlier call. Long-running callers
+    can pass the result of :func:`_bind_strategy` as ``strategy_call`` to skip
+    resolving the strategy on every call.
+
+    ``logged_through`` maps each symbol to the newest signal timestamp this
+    caller has written to the signal log; older signals from overlapping
+    windows are not written again and the mapping is advanced after each
+    write. Live mode keeps one such mapping per session.
+    """
     try:
-        if strategy not in STRATEGY_REGISTRY:
-            raise ValueError("Unknown strategy. Use --list-strategies to view options.")
+        if strategy_call is None:
+            strategy_call = _bind_strategy(
+                strategy,
+                sma_short,
+                sma_long,
+                confluence_members=confluence_members,
+                confluence_required=confluence_required,
+            )
 
-        if exchange:
+        if cache_candles:
+            data = _fetch_candles(symbol, timeframe, limit, exchange=exchange)
+        elif exchange:
             data = fetch_market_data(symbol, timeframe, limit, exchange=exchange)
         else:
             data = fetch_market_data(symbol, timeframe, limit)
         logger.info("Fetched %d data points for %s (%s)", len(data), symbol, timeframe)
 
-        entry = STRATEGY_REGISTRY[strategy]
-        strategy_fn = entry.func
-        metadata = entry.metadata
-
-        if strategy == "rsi":
-            signals = strategy_fn(
-                data,
-                period=DEFAULT_RSI_PERIOD,
-                lower_thresh=DEFAULT_RSI_LOWER,
-                upper_thresh=DEFAULT_RSI_UPPER,
-            )
-        elif strategy == "macd":
-            signals = strategy_fn(data)
-        elif strategy == "bbands":
-            signals = strategy_fn(
-                data,
-                window=sma_long,
-                num_std=DEFAULT_BBANDS_STD,
-            )
-        elif strategy == "confluence":
-            if confluence_members is None:
-                confluence_members = metadata.get("requires")
-            if confluence_required is None:
-                confluence_required = metadata.get("required_count")
-            signals = strategy_fn(
-                data,
-                members=confluence_members,
-                required=confluence_required,
-            )
-        else:  # SMA, EMA, etc. that accept two windows
-            signals = strategy_fn(data, sma_short, sma_long)
+        cache_key = (symbol, timeframe, limit)
+        if cache_candles:
+            # _fetch_candles hands back the same frame until a new candle opens;
+            # its signals were already returned, logged and alerted
+            analysed = _ANALYSED_CANDLES.get(cache_key)
+            if analysed is not None and analysed[0] is data and analysed[1] is strategy_call:
+                logger.debug("Candles for %s unchanged; no new signals", symbol)
+                return []
 
+        signals = strategy_call(data)
         logger.info("Generated %d trading signals for %s", len(signals), symbol)
         if signals:
+            # Callers report the signals they act on, so the per-signal trace
+            # is debug-only and skipped entirely unless it will be emitted.
+            log_each = logger.isEnabledFor(logging.DEBUG)
             for s in signals:
                 s["strategy"] = strategy
-                logger.info(
-                    "Signal generated: symbol=%s action=%s price=%.4f strategy=%s",
-                    symbol,
-                    s["action"],
-                    float(s["price"]),
-                    strategy,
-                )
-            log_signals_to_file(signals, symbol, state_dir)
-            db_path = os.path.join(state_dir or default_state_dir(), "signals.db")
-            log_signals_to_db(signals, symbol, db_path=db_path)
+                if log_each:
+                    logger.debug(
+                        "Signal generated: symbol=%s action=%s price=%.4f strategy=%s",
+                        symbol,
+                        s["action"],
+                        float(s["price"]),
+                        strategy,
+                    )
+            if logged_through is None:
+                log_signals_to_file(signals, symbol, state_dir)
+            else:
+                to_log = _unlogged_signals(signals, symbol, logged_through.get(symbol))
+                if log_signals_to_file(to_log, symbol, state_dir):
+                    logged_through[symbol] = to_log[-1]["timestamp"]
+            if log_to_db:
+                db_path = os.path.join(state_dir or default_state_dir(), "signals.db")
+                log_signals_to_db(signals, symbol, db_path=db_path)
             if alert_mode:
-                for s in signals:
-                    send_alert(s)
+                send_alerts(signals)
+        if cache_candles:
+            _ANALYSED_CANDLES[cache_key] = (data, strategy_call)
         return signals
     except Exception:
         logger.exception("Error in analysis cycle for %s", symbol)
         return []
 
 
+def _log_status(
+    status: str,
+    symbol: str,
+    action: str,
+    timestamp: str,
+    price: Optional[float] = None,
+    qty: Optional[float] = None,
+    strategy: Optional[str] = None,
+) -> None:
+    """Log a JSON status line for a processed signal.
+
+    ``price``, ``qty`` and ``strategy`` are included only for trades that were
+    placed or executed.
+    """
+    payload: Dict[str, Any] = {"symbol": symbol, "action": action}
+    if status != "duplicate":
+        payload["price"] = price
+        payload["qty"] = qty
+        payload["strategy"] = strategy
+    payload["timestamp"] = timestamp
+    payload["status"] = status
+    logger.info(json.dumps(payload))
+
+
+def _sleep_until(deadline: float) -> float:
+    """Sleep until the monotonic ``deadline`` and return the tick to schedule from.
+
+    If the deadline has already passed the schedule restarts from now rather
+    than running back-to-back iterations to catch up.
+    """
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        logger.info("Next analysis in %.1f seconds...", delay)
+        time.sleep(delay)
+        return deadline
+    logger.warning("Iteration overran by %.3fs", -delay)
+    return time.monotonic()
+
+
 def run_live_mode(
     symbols: Sequence[str],
     timeframe: str,
@@ -463,7 +838,7 @@ def run_live_mode(
     sma_long: int,
     strategy: str = "sma",
     alert_mode: bool = False,
-    exchange: Optional[Exchange] = None,
+    exchange: Optional["Exchange"] = None,
     live_trade: bool = False,
     trade_amount: float = 0.0,
     fee_bps: float = 0.0,
@@ -483,12 +858,25 @@ def run_live_mode(
 ) -> None:
     state_dir = state_dir or default_state_dir()
     retry_policy = retry_policy or default_retry()
+    # Create the logs directory up front so signal and order writes never have to
+    _ensure_logs_dir(state_dir)
     db_path = os.path.join(state_dir, "signals.db")
+    # One connection for the whole session instead of reconnecting per signal
+    db_conn = get_connection(db_path)
     live_limit = 25
     sig.signal(sig.SIGINT, signal_handler)
 
-    if strategy not in STRATEGY_REGISTRY:
-        raise ValueError("Unknown strategy. Use --list-strategies to view options.")
+    from trading_bot.exchange import execute_trade
+
+    # The strategy is fixed for the session, so resolve it and bind its
+    # parameters once instead of on every analysis call
+    strategy_call = _bind_strategy(
+        strategy,
+        sma_short,
+        sma_long,
+        confluence_members=confluence_members,
+        confluence_required=confluence_required,
+    )
 
     logger.info("=== Live Trading Mode Started ===")
     logger.info("Symbols: %s", ", ".join(symbols))
@@ -513,8 +901,6 @@ def run_live_mode(
     if risk_config is not None:
         md_cfg = getattr(risk_config, "max_drawdown", None)
         if md_cfg and (getattr(md_cfg, "monthly_pct", 0) > 0 or getattr(md_cfg, "cooldown_bars", 0) > 0):
-            from trading_bot.risk.guardrails import Guardrails
-
             guardrails = Guardrails(
                 max_dd_pct=md_cfg.monthly_pct,
                 cooldown_minutes=md_cfg.cooldown_bars,
@@ -558,9 +944,64 @@ def run_live_mode(
                 return 0.0
         return 0.0
 
+    # How orders are routed is fixed for the session, so pick the executor
+    # once. It returns the status to report, or ``None`` if the paper
+    # broker/portfolio rejected the trade.
+    execute_order: Callable[[str, str, float, float], Optional[str]]
+    if live_trade and exchange is not None:
+        live_exchange = exchange
+
+        def execute_order(sym: str, action: str, qty: float, price: float) -> Optional[str]:
+            order = execute_trade(live_exchange, sym, action, qty)
+            log_order_to_file(order, sym, state_dir)
+            return "placed"
+
+    elif broker is not None:
+        paper_broker = broker
+
+        def execute_order(sym: str, action: str, qty: float, price: float) -> Optional[str]:
+            try:
+                paper_broker.set_price(sym, price)
+                trade = paper_broker.create_order(action, sym, qty)
+            except ValueError:
+                logger.debug("Trade skipped due to portfolio/broker constraints")
+                return None
+            trade["strategy"] = strategy
+            log_trade_to_db(trade, db_path=db_path, conn=db_conn)
+            return "executed"
+
+    else:
+        # A simulated portfolio is always created when there is no broker
+        assert portfolio is not None
+        sim_portfolio = portfolio
+
+        def execute_order(sym: str, action: str, qty: float, price: float) -> Optional[str]:
+            try:
+                if action == "buy":
+                    sim_portfolio.buy(sym, qty, price, fee_bps=fee_bps)
+                else:
+                    sim_portfolio.sell(sym, qty, price, fee_bps=fee_bps)
+            except ValueError:
+                logger.debug("Trade skipped due to portfolio/broker constraints")
+                return None
+            return "executed"
+
+    # Newest signal written to the signal log per symbol this session; the
+    # analysis windows overlap, so only later signals are appended again
+    logged_through: Dict[str, Any] = {}
+
+    count_signals = metrics.SIGNALS_GENERATED.inc
+    count_trade = metrics.TRADES_EXECUTED.inc
+
+    # Monotonic schedule so the iteration's own runtime doesn't add drift
+    next_tick = time.monotonic()
     while True:
         iteration += 1
-        today = datetime.now(timezone.utc).date()
+        next_tick += interval_seconds
+        # One clock read per iteration, shared by the day roll-over, the
+        # guardrails and the iteration banner
+        now = datetime.now(timezone.utc)
+        today = now.date()
         if today != day_start:
             day_start = today
             if portfolio:
@@ -580,246 +1021,214 @@ def run_live_mode(
 
         if guardrails and portfolio and not daily_halted:
             eq = portfolio.equity()
-            now = datetime.now(timezone.utc)
             if guardrails.should_halt(eq):
                 logger.warning("Guardrails triggered - halting trading")
                 break
             if not guardrails.allow_trade(eq, now=now):
                 logger.info("Guardrails active - skipping iteration")
-                time.sleep(interval_seconds)
+                next_tick = _sleep_until(next_tick)
                 continue
 
-        now_iso = datetime.now(timezone.utc).isoformat()
-        logger.info("[%s] Iteration #%d", now_iso, iteration)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[%s] Iteration #%d", now.isoformat(), iteration)
 
         def _iteration_body():
             nonlocal last_trade_time, daily_halted
-            for sym in symbols:
-                current_price: Optional[float] = None
-                if exchange is not None:
-                    try:
-                        ticker = exchange.fetch_ticker(sym)
-                        current_price = (
-                            ticker.get("last")
-                            or ticker.get("close")
-                            or ticker.get("ask")
-                            or ticker.get("bid")
-                        )
-                    except Exception:
-                        current_price = None
-                elif broker is not None:
-                    try:
-                        current_price = broker.get_price(sym)
-                    except Exception:
-                        current_price = None
-                if current_price is not None and broker is not None:
-                    broker.set_price(sym, float(current_price))
-                if exit_manager is not None and current_price is not None:
-                    pos_qty = 0.0
-                    if broker is not None:
-                        pos_qty = broker.get_open_positions().get(sym, 0.0)
-                    elif portfolio is not None:
-                        pos_qty = portfolio.position_qty(sym)
-                    if pos_qty > 0:
-                        arm = exit_manager.arms.get(sym)
-                        exit_price = exit_manager.check(sym, float(current_price))
-                        if exit_price is not None:
-                            if broker is not None:
-                                broker.set_price(sym, float(exit_price))
-                                broker.create_order("sell", sym, pos_qty)
-                            elif portfolio is not None:
-                                portfolio.sell(sym, pos_qty, float(exit_price), fee_bps=fee_bps)
-                            if arm and exit_manager.stop_loss_pct is not None and exit_price <= arm.entry_price * (1 - exit_manager.stop_loss_pct / 100):
-                                logger.info(
-                                    "Stop-loss triggered at $%.4f, selling %.4f.",
-                                    exit_price,
-                                    pos_qty,
-                                )
-                            else:
-                                logger.info(
-                                    "Take-profit target hit at $%.4f, selling %.4f.",
-                                    exit_price,
-                                    pos_qty,
-                                )
-                            continue
-                signals = run_single_analysis(
-                    sym,
-                    timeframe,
-                    live_limit,
-                    sma_short,
-                    sma_long,
-                    strategy=strategy,
-                    alert_mode=alert_mode,
-                    exchange=exchange,
-                    confluence_members=confluence_members,
-                    confluence_required=confluence_required,
-                    state_dir=state_dir,
-                )
-                metrics.SIGNALS_GENERATED.inc(len(signals))
-                if not signals:
-                    logger.info("No new signals for %s.", sym)
-                    continue
-
-                logger.info("✅ NEW SIGNALS for %s (%d)", sym, len(signals))
-
-                for signal in signals[-3:]:  # show last few
-                    ts = signal["timestamp"].isoformat()
-                    action = signal["action"]
-                    price = signal["price"]
-
-                    if mark_signal_handled(
+            # Re-evaluated every iteration so runtime level changes are honoured
+            info_enabled = logger.isEnabledFor(logging.INFO)
+            # Signals from every symbol are written in one transaction at the end
+            pending_signals: List[Any] = []
+            try:
+                for sym in symbols:
+                    current_price: Optional[float] = None
+                    if exchange is not None:
+                        try:
+                            ticker = exchange.fetch_ticker(sym)
+                            current_price = (
+                                ticker.get("last")
+                                or ticker.get("close")
+                                or ticker.get("ask")
+                                or ticker.get("bid")
+                            )
+                        except Exception:
+                            current_price = None
+                    elif broker is not None:
+                        try:
+                            current_price = broker.get_price(sym)
+                        except Exception:
+                            current_price = None
+                    if current_price is not None and broker is not None:
+                        broker.set_price(sym, float(current_price))
+                    if exit_manager is not None and current_price is not None:
+                        pos_qty = 0.0
+                        if broker is not None:
+                            pos_qty = broker.get_open_positions().get(sym, 0.0)
+                        elif portfolio is not None:
+                            pos_qty = portfolio.position_qty(sym)
+                        if pos_qty > 0:
+                            arm = exit_manager.arms.get(sym)
+                            exit_price = exit_manager.check(sym, float(current_price))
+                            if exit_price is not None:
+                                if broker is not None:
+                                    broker.set_price(sym, float(exit_price))
+                                    broker.create_order("sell", sym, pos_qty)
+                                elif portfolio is not None:
+                                    portfolio.sell(sym, pos_qty, float(exit_price), fee_bps=fee_bps)
+                                if arm and exit_manager.stop_loss_pct is not None and exit_price <= arm.entry_price * (1 - exit_manager.stop_loss_pct / 100):
+                                    logger.info(
+                                        "Stop-loss triggered at $%.4f, selling %.4f.",
+                                        exit_price,
+                                        pos_qty,
+                                    )
+                                else:
+                                    logger.info(
+                                        "Take-profit target hit at $%.4f, selling %.4f.",
+                                        exit_price,
+                                        pos_qty,
+                                    )
+                                continue
+                    signals = run_single_analysis(
                         sym,
-                        strategy,
                         timeframe,
-                        ts,
-                        action,
-                        db_path=db_path,
-                    ):
-                        logger.info(
-                            json.dumps(
-                                {
-                                    "symbol": sym,
-                                    "action": action,
-                                    "timestamp": ts,
-                                    "status": "duplicate",
-                                }
-                            )
-                        )
-                        continue
-
-                    if daily_halted:
-                        logger.info("Daily loss limit reached - skipping trade execution")
+                        live_limit,
+                        sma_short,
+                        sma_long,
+                        strategy=strategy,
+                        alert_mode=alert_mode,
+                        exchange=exchange,
+                        confluence_members=confluence_members,
+                        confluence_required=confluence_required,
+                        state_dir=state_dir,
+                        log_to_db=False,
+                        cache_candles=True,
+                        strategy_call=strategy_call,
+                        logged_through=logged_through,
+                    )
+                    if signals:
+                        pending_signals.append((sym, signals))
+                    count_signals(len(signals))
+                    if not signals:
+                        logger.info("No new signals for %s.", sym)
                         continue
 
-                    # Determine quantity and equity
-                    equity = portfolio.equity({sym: price}) if portfolio else 0
-                    qty = trade_amount or 0.0
-                    if not trade_amount and risk_config:
-                        qty = calculate_position_size(risk_config.position_sizing, price, equity)
-                    if action == "buy" and portfolio and MAX_POSITION_PCT < 1.0:
-                        current_val = portfolio.position_qty(sym) * price
-                        allowed_val = equity * MAX_POSITION_PCT - current_val
-                        if allowed_val <= 0:
-                            qty = 0.0
-                        else:
-                            qty = min(qty, allowed_val / price)
-                        if qty == 0:
-                            logger.debug("Skipping buy; max_position_pct reached")
+                    logger.info("✅ NEW SIGNALS for %s (%d)", sym, len(signals))
+
+                    # Every signal is counted and stored, but only the most
+                    # recent ones in the window are traded
+                    for signal in signals[-_LIVE_SIGNAL_TAIL:]:
+                        timestamp, action, price = _SIGNAL_FIELDS(signal)
+                        ts = timestamp.isoformat()
+                        signal_strategy = signal.get("strategy", strategy)
+
+                        if mark_signal_handled(
+                            sym,
+                            strategy,
+                            timeframe,
+                            ts,
+                            action,
+                            db_path=db_path,
+                            conn=db_conn,
+                        ):
+                            if info_enabled:
+                                _log_status("duplicate", sym, action, ts)
                             continue
-                    if guardrails and not guardrails.allow_trade(equity, price=price, qty=qty):
-                        logger.info("Guardrails blocked trade due to limits")
-                        continue
 
-                    if (
-                        action == "buy"
-                        and min_balance_threshold > 0
-                        and _available_cash(sym) < min_balance_threshold
-                    ):
-                        logger.warning(
-                            "Balance below minimum $%s – halting new trades.",
-                            min_balance_threshold,
-                        )
-                        continue
+                        if daily_halted:
+                            logger.info("Daily loss limit reached - skipping trade execution")
+                            continue
 
-                    now_ts = time.time()
-                    if (
-                        min_trade_interval_sec > 0
-                        and last_trade_time is not None
-                        and now_ts - last_trade_time < min_trade_interval_sec
-                    ):
-                        logger.info(
-                            "Trade signal at %s skipped – last trade %.0f seconds ago.",
-                            datetime.fromtimestamp(now_ts, timezone.utc).strftime("%H:%M"),
-                            now_ts - last_trade_time,
-                        )
-                        continue
+                        # Determine quantity and equity
+                        equity = portfolio.equity({sym: price}) if portfolio else 0
+                        qty = trade_amount or 0.0
+                        if not trade_amount and risk_config:
+                            qty = calculate_position_size(risk_config.position_sizing, price, equity)
+                        if action == "buy" and portfolio and MAX_POSITION_PCT < 1.0:
+                            current_val = portfolio.position_qty(sym) * price
+                            allowed_val = equity * MAX_POSITION_PCT - current_val
+                            if allowed_val <= 0:
+                                qty = 0.0
+                            else:
+                                qty = min(qty, allowed_val / price)
+                            if qty == 0:
+                                logger.debug("Skipping buy; max_position_pct reached")
+                                continue
+                        if qty <= 0:
+                            # Nothing to trade, so skip the guardrail and execution work
+                            logger.debug("Skipping %s for %s; computed quantity is zero", action, sym)
+                            continue
+                        if guardrails and not guardrails.allow_trade(equity, price=price, qty=qty):
+                            logger.info("Guardrails blocked trade due to limits")
+                            continue
 
-                    logger.info(
-                        "Processing signal: symbol=%s action=%s price=%.4f qty=%f strategy=%s",
-                        sym,
-                        action.upper(),
-                        float(price),
-                        qty,
-                        signal.get("strategy", strategy),
-                    )
+                        if (
+                            action == "buy"
+                            and min_balance_threshold > 0
+                            and _available_cash(sym) < min_balance_threshold
+                        ):
+                            logger.warning(
+                                "Balance below minimum $%s – halting new trades.",
+                                min_balance_threshold,
+                            )
+                            continue
 
-                    # Execute trade
-                    if live_trade and exchange:
-                        order = execute_trade(exchange, sym, action, qty)
-                        log_order_to_file(order, sym, state_dir)
-                        logger.info(
-                            json.dumps(
-                                {
-                                    "symbol": sym,
-                                    "action": action,
-                                    "price": price,
-                                    "qty": qty,
-                                    "strategy": signal.get("strategy", strategy),
-                                    "timestamp": ts,
-                                    "status": "placed",
-                                }
+                        now_ts = time.time()
+                        if (
+                            min_trade_interval_sec > 0
+                            and last_trade_time is not None
+                            and now_ts - last_trade_time < min_trade_interval_sec
+                        ):
+                            logger.info(
+                                "Trade signal at %s skipped – last trade %.0f seconds ago.",
+                                datetime.fromtimestamp(now_ts, timezone.utc).strftime("%H:%M"),
+                                now_ts - last_trade_time,
                             )
-                        )
-                        metrics.TRADES_EXECUTED.inc()
-                        last_trade_time = now_ts
-                    else:
-                        try:
-                            if broker:
-                                # Price update + broker order
-                                broker.set_price(sym, price)
-                                trade = broker.create_order(action, sym, qty)
-                                trade["strategy"] = strategy
-                                log_trade_to_db(trade, db_path=db_path)
-                            elif portfolio:
-                                if action == "buy":
-                                    portfolio.buy(sym, qty, price, fee_bps=fee_bps)
-                                else:
-                                    portfolio.sell(sym, qty, price, fee_bps=fee_bps)
+                            continue
+
+                        if info_enabled:
                             logger.info(
-                                json.dumps(
-                                    {
-                                        "symbol": sym,
-                                        "action": action,
-                                        "price": price,
-                                        "qty": qty,
-                                        "strategy": signal.get("strategy", strategy),
-                                        "timestamp": ts,
-                                        "status": "executed",
-                                    }
-                                )
+                                "Processing signal: symbol=%s action=%s price=%.4f qty=%f strategy=%s",
+                                sym,
+                                action.upper(),
+                                float(price),
+                                qty,
+                                signal_strategy,
                             )
-                            metrics.TRADES_EXECUTED.inc()
+
+                        status = execute_order(sym, action, qty, price)
+                        if status is not None:
+                            if info_enabled:
+                                _log_status(status, sym, action, ts, price, qty, signal_strategy)
+                            count_trade()
                             last_trade_time = now_ts
-                        except ValueError:
-                            logger.debug("Trade skipped due to portfolio/broker constraints")
-
-                    if exit_manager is not None:
-                        if action == "buy" and qty > 0:
-                            exit_manager.arm(sym, float(price))
-                            sl_price = price * (1 - stop_loss_pct) if stop_loss_pct > 0 else None
-                            tp_price = price * (1 + take_profit_pct) if take_profit_pct > 0 else None
-                            msg_parts = []
-                            if sl_price is not None:
-                                msg_parts.append(f"stop-loss at ${sl_price:.4f}")
-                            if tp_price is not None:
-                                msg_parts.append(f"take-profit at ${tp_price:.4f}")
-                            if msg_parts:
-                                logger.info("Set %s for this trade", " and ".join(msg_parts))
-                        elif action == "sell":
-                            exit_manager.disarm(sym)
-
-                    if portfolio and daily_loss_limit_pct > 0:
-                        daily_pnl = portfolio.realized_pnl - start_day_realized_pnl
-                        if daily_pnl <= -daily_loss_limit_pct * daily_start_equity:
-                            logger.warning(
-                                "Daily max loss exceeded (>-%s%%). Trading halted until next day.",
-                                daily_loss_limit_pct * 100,
-                            )
-                            daily_halted = True
-                            return
 
-                    if guardrails and qty > 0:
-                        guardrails.record_trade(0)
+                        if exit_manager is not None:
+                            if action == "buy" and qty > 0:
+                                exit_manager.arm(sym, float(price))
+                                if logger.isEnabledFor(logging.INFO):
+                                    msg_parts = []
+                                    if stop_loss_pct > 0:
+                                        msg_parts.append("stop-loss at $%.4f" % (price * (1 - stop_loss_pct)))
+                                    if take_profit_pct > 0:
+                                        msg_parts.append("take-profit at $%.4f" % (price * (1 + take_profit_pct)))
+                                    if msg_parts:
+                                        logger.info("Set %s for this trade", " and ".join(msg_parts))
+                            elif action == "sell":
+                                exit_manager.disarm(sym)
+
+                        if portfolio and daily_loss_limit_pct > 0:
+                            daily_pnl = portfolio.realized_pnl - start_day_realized_pnl
+                            if daily_pnl <= -daily_loss_limit_pct * daily_start_equity:
+                                logger.warning(
+                                    "Daily max loss exceeded (>-%s%%). Trading halted until next day.",
+                                    daily_loss_limit_pct * 100,
+                                )
+                                daily_halted = True
+                                return
+
+                        if guardrails:
+                            guardrails.record_trade(0)
+            finally:
+                log_signals_batch(pending_signals, db_path=db_path, conn=db_conn)
 
         try:
             retry_policy.call(_iteration_body)
@@ -830,30 +1239,42 @@ def run_live_mode(
         if portfolio:
             metrics.PNL_GAUGE.set(portfolio.realized_pnl)
 
-        logger.info("Next analysis in %d seconds...", interval_seconds)
-        time.sleep(interval_seconds)
+        next_tick = _sleep_until(next_tick)
 
 
 def main() -> None:
     args = parse_args()
     state_dir = args.state_dir or default_state_dir()
     setup_logging(level=args.log_level, state_dir=state_dir, json_logs=args.json_logs)
+    registry = _get_registry()
+
+    # List strategies and exit before any config, risk or exchange setup
+    if args.list_strategies:
+        logger.info("Available strategies:")
+        for name, entry in registry.items():
+            meta = entry.metadata
+            if meta:
+                logger.info("- %s: %s", name, meta)
+            else:
+                logger.info("- %s", name)
+        return
+
     config = get_config()
     configure_alerts(config)
-    risk_config = get_risk_config(config.get("risk"), getattr(args, "risk_overrides", {}))
+    risk_config = get_risk_config(config.get("risk"), args.risk_overrides)
 
     symbol = args.symbol or config["symbol"]
-    symbols = args.symbols.split(",") if getattr(args, "symbols", None) else [symbol]
+    symbols = args.symbols.split(",") if args.symbols else [symbol]
     timeframe = args.timeframe or config["timeframe"]
     limit = args.limit or config["limit"]
-    sma_short = getattr(args, "sma_short") or config["sma_short"]
-    sma_long = getattr(args, "sma_long") or config["sma_long"]
-    strategy_choice = getattr(args, "strategy", "sma")
-    alert_mode = getattr(args, "alert_mode", False)
-    interval_seconds = getattr(args, "interval_seconds", 60)
+    sma_short = args.sma_short or config["sma_short"]
+    sma_long = args.sma_long or config["sma_long"]
+    strategy_choice = args.strategy
+    alert_mode = args.alert_mode
+    interval_seconds = args.interval_seconds
 
     confluence_cfg = config.get("confluence", {})
-    confluence_meta = STRATEGY_REGISTRY["confluence"].metadata
+    confluence_meta = registry["confluence"].metadata
     confluence_members = confluence_cfg.get("members", confluence_meta.get("requires"))
     confluence_required = confluence_cfg.get("required", confluence_meta.get("required_count"))
 
@@ -867,17 +1288,21 @@ def main() -> None:
     slippage_bps = broker_cfg.get("slippage_bps", 5.0)
     stop_loss_pct = (
         args.stop_loss_pct
-        if getattr(args, "stop_loss_pct", None) is not None
+        if args.stop_loss_pct is not None
         else config.get("stop_loss_pct", 0.0)
     )
     take_profit_pct = (
         args.take_profit_pct
-        if getattr(args, "take_profit_pct", None) is not None
+        if args.take_profit_pct is not None
         else config.get("take_profit_pct", 0.0)
     )
-    broker_type = getattr(args, "broker", None) or broker_cfg.get("type", "paper")
+    broker_type = args.broker or broker_cfg.get("type", "paper")
     exchange_name = args.exchange or config.get("exchange", "binance")
 
+    from trading_bot.backtester import run_backtest
+    from trading_bot.broker import CcxtSpotBroker, PaperBroker
+    from trading_bot.exchange import create_exchange
+
     # Exchange
     if api_key and api_secret:
         exchange = create_exchange(api_key, api_secret, api_passphrase, exchange_name)
@@ -893,20 +1318,9 @@ def main() -> None:
             slippage_bps=slippage_bps,
         )
     elif broker_type == "ccxt":
-        broker = CcxtSpotBroker(exchange=exchange, fees_bps=fee_bps, dry_run=getattr(args, "dry_run", False))
-
-    # List strategies and exit
-    if getattr(args, "list_strategies", False):
-        logger.info("Available strategies:")
-        for name, entry in STRATEGY_REGISTRY.items():
-            meta = entry.metadata
-            if meta:
-                logger.info("- %s: %s", name, meta)
-            else:
-                logger.info("- %s", name)
-        return
+        broker = CcxtSpotBroker(exchange=exchange, fees_bps=fee_bps, dry_run=args.dry_run)
 
-    if strategy_choice not in STRATEGY_REGISTRY:
+    if strategy_choice not in registry:
         raise ValueError("Unknown strategy. Use --list-strategies to view options.")
 
     try:
@@ -925,7 +1339,7 @@ def main() -> None:
             logger.info("=== Tuning Results ===")
             for res in results:
                 params_str = ", ".join(f"{k}={v}" for k, v in res["params"].items())
-                logger.info(f"{params_str} -> PnL {res['net_pnl']:.2f}, Win {res['win_rate']:.2f}%")
+                logger.info("%s -> PnL %.2f, Win %.2f%%", params_str, res["net_pnl"], res["win_rate"])
             if results:
                 logger.info("Best parameters: %s", results[0]["params"])
             return
@@ -948,7 +1362,10 @@ def main() -> None:
                 params_str = ", ".join(f"{k}={v}" for k, v in res["best_params"].items())
                 stats = res["test_stats"]
                 logger.info(
-                    f"{params_str} -> Test PnL {stats.get('net_pnl', 0.0):.2f}, Win {stats.get('win_rate', 0.0):.2f}%"
+                    "%s -> Test PnL %.2f, Win %.2f%%",
+                    params_str,
+                    stats.get("net_pnl", 0.0),
+                    stats.get("win_rate", 0.0),
                 )
             return
 
@@ -1014,9 +1431,8 @@ def main() -> None:
             logger.info("Total signals: %d", len(signals))
             if signals:
                 logger.info("Last 5 signals:")
-                for i, s in enumerate(signals[-5:], 1):
-                    ts = s["timestamp"].isoformat()
-                    logger.info("%d. %s - %s @ $%.2f", i, ts, s["action"].upper(), s["price"])
+                for i, (ts, action, price) in enumerate(map(_SIGNAL_FIELDS, signals[-5:]), 1):
+                    logger.info("%d. %s - %s @ $%.2f", i, ts.isoformat(), action.upper(), price)
             else:
                 logger.info("No trading signals generated.")
     except Exception:
@@ -1,11 +1,9 @@
 import logging
 import time
-from typing import Iterable, Optional
+from typing import Any, Iterable, Mapping, Optional
 
-try:  # pragma: no cover - optional dependency
-    from plyer import notification as desktop_notify
-except ImportError:  # pragma: no cover
-    desktop_notify = None
+# Lazily imported on first desktop alert; ``False`` marks plyer as unavailable.
+desktop_notify: Any = None
 
 ALERTS_ENABLED = False
 HEARTBEAT_LAPSE: int = 0
@@ -15,7 +13,7 @@ MAX_DD_PCT: float = 0.0
 logger = logging.getLogger(__name__)
 
 
-def configure(config: Optional[dict]) -> None:
+def configure(config: Optional[Mapping[str, Any]]) -> None:
     """Configure alert settings from ``config`` dictionary."""
     global ALERTS_ENABLED, HEARTBEAT_LAPSE, MAX_DD_PCT
     alerts = (config or {}).get("alerts", {})
@@ -24,14 +22,26 @@ def configure(config: Optional[dict]) -> None:
     MAX_DD_PCT = alerts.get("max_dd_pct", 0.0)
 
 
+def _load_desktop_notify() -> Any:
+    global desktop_notify
+    if desktop_notify is None:
+        try:  # pragma: no cover - optional dependency
+            from plyer import notification as _notification
+        except ImportError:  # pragma: no cover
+            desktop_notify = False
+        else:
+            desktop_notify = _notification
+    return desktop_notify
+
+
 def send(message: str, channels: Optional[Iterable[str]] = None) -> None:
     """Send ``message`` via specified channels if alerts enabled."""
     if not ALERTS_ENABLED:
         return
     channels = list(channels or ["console"])
     if "console" in channels:
-        logger.error(f"ALERT: {message}")
-    if "desktop" in channels and desktop_notify:
+        logger.error("ALERT: %s", message)
+    if "desktop" in channels and _load_desktop_notify():
         try:  # pragma: no cover - desktop notifications not testable
             desktop_notify.notify(title="Trading Bot Alert", message=message)
         except Exception as exc:  # pragma: no cover
@@ -2,7 +2,6 @@ import pandas as pd
 from typing import List, Tuple, Dict
 
 from trading_bot.backtester import compute_drawdown
-from trading_bot.portfolio import Portfolio
 from trading_bot.config import get_config
 
 
@@ -51,42 +50,54 @@ def compute_equity_curve(
         }
         return empty_df, stats
 
-    # Ensure signals are sorted chronologically
-    sorted_signals = sorted(signals, key=lambda x: x["timestamp"])
-
-    portfolio = Portfolio(cash=initial_balance)
-    equity_curve = []
+    # Convert all timestamps in one call instead of once per signal, then
+    # order the signals chronologically with a stable sort on the converted
+    # values rather than a Python key function
+    timestamps = pd.to_datetime([sig["timestamp"] for sig in signals], utc=True, format="mixed")
+    order = timestamps.argsort(kind="stable")
+    timestamps = timestamps[order]
+    sorted_signals = [signals[i] for i in order]
+
+    # Whether a buy is affordable depends on the cash left by earlier trades,
+    # so the signals are replayed in order. The single-symbol position is
+    # kept in plain floats using the same arithmetic and checks as
+    # ``Portfolio.buy``/``Portfolio.sell``.
+    cash = float(initial_balance)
+    qty = avg_cost = 0.0
+    equity_values: List[float] = []
     wins = trades = 0
 
     for sig in sorted_signals:
-        ts = pd.to_datetime(sig["timestamp"], utc=True)
         price = float(sig["price"])
         action = str(sig["action"]).lower()
 
-        try:
+        # Non-positive sizes or prices are rejected by the portfolio
+        if price > 0 and trade_size > 0:
             if action == "buy":
-                portfolio.buy(symbol, trade_size, price, fee_bps=fees_bps)
-            elif action == "sell":
-                pos = portfolio.positions.get(symbol)
-                if pos and pos.qty >= trade_size:
-                    avg_cost = pos.avg_cost
-                    portfolio.sell(symbol, trade_size, price, fee_bps=fees_bps)
-                    trades += 1
-                    if price > avg_cost:
-                        wins += 1
-        except ValueError:
-            # Skip trades that violate portfolio constraints
-            pass
-
-        equity_curve.append({"timestamp": ts, "equity": portfolio.equity({symbol: price})})
-
-    final_price = float(sorted_signals[-1]["price"])
-    final_equity = portfolio.equity({symbol: final_price})
+                cost = price * trade_size
+                total = cost + cost * fees_bps / 10_000
+                if total <= cash + 1e-12:
+                    cash -= total
+                    new_qty = qty + trade_size
+                    avg_cost = (avg_cost * qty + cost) / new_qty if qty > 0 else cost / trade_size
+                    qty = new_qty
+            elif action == "sell" and qty > 0 and qty >= trade_size:
+                proceeds = price * trade_size
+                cash += proceeds - proceeds * fees_bps / 10_000
+                qty -= trade_size
+                trades += 1
+                if price > avg_cost:
+                    wins += 1
+                if qty <= 1e-12:
+                    qty = avg_cost = 0.0
+
+        equity_values.append(cash + qty * price if qty > 0 else cash)
+
+    final_equity = equity_values[-1]
     total_return_abs = final_equity - initial_balance
     total_return_pct = (total_return_abs / initial_balance) * 100
 
-    equity_values = [pt["equity"] for pt in equity_curve]
-    max_dd = compute_drawdown(equity_values) if equity_values else 0.0
+    max_dd = compute_drawdown(equity_values)
     win_rate = (wins / trades * 100) if trades else 0.0
 
     stats = {
@@ -97,5 +108,5 @@ def compute_equity_curve(
         "max_drawdown": float(max_dd),
     }
 
-    df = pd.DataFrame(equity_curve)
+    df = pd.DataFrame({"timestamp": timestamps, "equity": equity_values})
     return df, stats
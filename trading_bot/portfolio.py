@@ -30,6 +30,9 @@ class Portfolio:
     # Last known prices for symbols to allow equity calculation without
     # always passing in a price dictionary.
     last_prices: Dict[str, float] = field(default_factory=dict)
+    # Market value of open positions at ``last_prices``; ``None`` once a
+    # trade or a price change for a held symbol makes it stale.
+    _position_value: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
     def buy(
         self,
@@ -56,6 +59,7 @@ class Portfolio:
         if total > self.cash + 1e-12:
             raise ValueError("insufficient cash")
         self.cash -= total
+        self._position_value = None
         # Buying incurs a fee which is realized immediately as a loss
         self.realized_pnl -= fee
         # track last trade price
@@ -95,6 +99,7 @@ class Portfolio:
         proceeds = price * qty
         fee = proceeds * fee_bps / 10_000
         self.cash += proceeds - fee
+        self._position_value = None
         # Realized profit/loss for this sale net of fees
         realized = (price - pos.avg_cost) * qty - fee
         self.realized_pnl += realized
@@ -112,24 +117,36 @@ class Portfolio:
         used for the valuation.  This allows callers to fetch equity once
         with prices and subsequently without needing to supply them again.
         """
-        if prices:
-            self.last_prices.update(prices)
-        return self.cash + self.total_position_value()
+        return self.cash + self.total_position_value(prices)
 
     def total_position_value(self, prices: Optional[Dict[str, float]] = None) -> float:
         """Return market value of all positions.
 
-        If ``prices`` is given they will update the cached last prices.
+        If ``prices`` is given they will update the cached last prices.  The
+        value is memoised until a trade or a new price for a held symbol.
         """
         if prices:
-            self.last_prices.update(prices)
-        value = 0.0
-        for symbol, pos in self.positions.items():
-            price = self.last_prices.get(symbol)
-            if price is not None:
-                value += pos.market_value(price)
+            self._update_prices(prices)
+        value = self._position_value
+        if value is None:
+            last_prices = self.last_prices
+            value = 0.0
+            for symbol, pos in self.positions.items():
+                price = last_prices.get(symbol)
+                if price is not None:
+                    value += pos.qty * price
+            self._position_value = value
         return value
 
+    def _update_prices(self, prices: Dict[str, float]) -> None:
+        last_prices = self.last_prices
+        positions = self.positions
+        for symbol, price in prices.items():
+            if last_prices.get(symbol) != price:
+                last_prices[symbol] = price
+                if symbol in positions:
+                    self._position_value = None
+
     def position_qty(self, symbol: str) -> float:
         pos = self.positions.get(symbol)
         return pos.qty if pos else 0.0
@@ -1,17 +1,42 @@
+import atexit
 import sqlite3
 import logging
 import os
-from typing import Optional, List, Tuple, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Sequence, Set, Tuple, Dict, Any
 
 from trading_bot.utils.state import default_state_dir
 
 logger = logging.getLogger(__name__)
 
+# Long-lived connections keyed by database path, see :func:`get_connection`.
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+# Database directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+# Keys this process has seen recorded in ``processed_signals``, keyed by
+# database path, so repeats are answered without a database round-trip.
+# Rows are never removed, so a remembered key stays handled.
+_HANDLED_SIGNALS: "OrderedDict[Tuple[str, str, str, str, str, str], None]" = OrderedDict()
+_HANDLED_SIGNALS_MAX = 4096
+_HANDLED_SIGNALS_LOCK = threading.Lock()
+
 
 def _default_db_path() -> str:
     return os.path.join(default_state_dir(), "signals.db")
 
 
+def _ensure_db_dir(db_path: str) -> None:
+    db_dir = os.path.dirname(db_path)
+    if db_dir not in _ENSURED_DIRS:
+        os.makedirs(db_dir, exist_ok=True)
+        _ENSURED_DIRS.add(db_dir)
+
+
 def create_signals_table(cursor: sqlite3.Cursor) -> None:
     """Create the signals table if it doesn't exist."""
     cursor.execute(
@@ -60,11 +85,33 @@ def create_trades_table(cursor: sqlite3.Cursor) -> None:
     )
 
 
+_INSERT_SIGNAL_SQL = """
+    INSERT INTO signals (timestamp, action, price, symbol, strategy_id)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _signal_rows(
+    signals: List[Dict[str, Any]], symbol: str, strategy_id: str
+) -> List[Tuple[str, str, float, str, str]]:
+    return [
+        (
+            s["timestamp"].isoformat(),
+            s["action"],
+            float(s["price"]),
+            symbol,
+            strategy_id,
+        )
+        for s in signals
+    ]
+
+
 def log_signals_to_db(
     signals: List[Dict[str, Any]],
     symbol: str,
     strategy_id: str = "sma",
     db_path: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """
     Log trading signals to SQLite database.
@@ -74,37 +121,21 @@ def log_signals_to_db(
         symbol: Trading pair symbol
         strategy_id: Strategy identifier (default: 'sma')
         db_path: Path to SQLite database file
+        conn: Optional shared connection from :func:`get_connection`
     """
     if not signals:
         return
 
     if db_path is None:
         db_path = _default_db_path()
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
     try:
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            create_signals_table(cursor)
-
-            rows = [
-                (
-                    s["timestamp"].isoformat(),
-                    s["action"],
-                    float(s["price"]),
-                    symbol,
-                    strategy_id,
-                )
-                for s in signals
-            ]
-            cursor.executemany(
-                """
-                INSERT INTO signals (timestamp, action, price, symbol, strategy_id)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                rows,
-            )
-            conn.commit()
+        if conn is None:
+            _ensure_db_dir(db_path)
+            conn = sqlite3.connect(db_path)
+            create_signals_table(conn.cursor())
+        with conn:
+            conn.executemany(_INSERT_SIGNAL_SQL, _signal_rows(signals, symbol, strategy_id))
             logger.info(
                 "Logged %d signals for %s (strategy=%s) to database %s",
                 len(signals),
@@ -123,16 +154,70 @@ def log_signals_to_db(
         raise
 
 
-def log_trade_to_db(trade: Dict[str, Any], db_path: Optional[str] = None) -> None:
-    """Log a single trade execution to the trades table."""
+def log_signals_batch(
+    entries: Sequence[Tuple[str, List[Dict[str, Any]]]],
+    strategy_id: str = "sma",
+    db_path: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
+    """Log signals for several symbols in a single transaction.
+
+    Args:
+        entries: ``(symbol, signals)`` pairs, e.g. one per symbol in a live
+            iteration
+        strategy_id: Strategy identifier (default: 'sma')
+        db_path: Path to SQLite database file
+        conn: Optional shared connection from :func:`get_connection`
+    """
+    rows = [row for symbol, signals in entries for row in _signal_rows(signals, symbol, strategy_id)]
+    if not rows:
+        return
+
     if db_path is None:
         db_path = _default_db_path()
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
     try:
-        with sqlite3.connect(db_path) as conn:
+        if conn is None:
+            _ensure_db_dir(db_path)
+            conn = sqlite3.connect(db_path)
+            create_signals_table(conn.cursor())
+        with conn:
+            conn.executemany(_INSERT_SIGNAL_SQL, rows)
+        logger.info(
+            "Logged %d signals for %d symbols (strategy=%s) to database %s",
+            len(rows),
+            len(entries),
+            strategy_id,
+            db_path,
+        )
+    except sqlite3.Error:
+        logger.exception(
+            "log_signals_batch: Database error for strategy=%s db_path=%s",
+            strategy_id,
+            db_path,
+        )
+        raise
+
+
+def log_trade_to_db(
+    trade: Dict[str, Any],
+    db_path: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
+    """Log a single trade execution to the trades table.
+
+    ``conn`` may be a shared connection from :func:`get_connection`.
+    """
+    if db_path is None:
+        db_path = _default_db_path()
+
+    try:
+        if conn is None:
+            _ensure_db_dir(db_path)
+            conn = sqlite3.connect(db_path)
+            create_trades_table(conn.cursor())
+        with conn:
             cursor = conn.cursor()
-            create_trades_table(cursor)
             cursor.execute(
                 """
                 INSERT INTO trades (timestamp, symbol, side, qty, price, fee, strategy, broker)
@@ -149,7 +234,6 @@ def log_trade_to_db(trade: Dict[str, Any], db_path: Optional[str] = None) -> Non
                     trade.get("broker", ""),
                 ),
             )
-            conn.commit()
             logger.info(
                 "Logged trade %s %s qty=%s price=%.4f strategy=%s to database %s",
                 trade["side"],
@@ -305,6 +389,43 @@ def _create_processed_table(cursor: sqlite3.Cursor) -> None:
     )
 
 
+def get_connection(db_path: Optional[str] = None) -> sqlite3.Connection:
+    """Return a shared connection to ``db_path``, opening it on first use.
+
+    The connection uses write-ahead logging so readers such as the dashboard
+    do not block writers, and all tables are created once when it is opened.
+    Pass it as ``conn`` to the logging helpers to avoid reconnecting per call.
+    """
+    if db_path is None:
+        db_path = _default_db_path()
+
+    with _CONNECTIONS_LOCK:
+        conn = _CONNECTIONS.get(db_path)
+        if conn is None:
+            _ensure_db_dir(db_path)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            cursor = conn.cursor()
+            create_signals_table(cursor)
+            create_trades_table(cursor)
+            _create_processed_table(cursor)
+            conn.commit()
+            _CONNECTIONS[db_path] = conn
+        return conn
+
+
+def close_connections() -> None:
+    """Close all connections opened by :func:`get_connection`."""
+    with _CONNECTIONS_LOCK:
+        for conn in _CONNECTIONS.values():
+            conn.close()
+        _CONNECTIONS.clear()
+
+
+atexit.register(close_connections)
+
+
 def mark_signal_handled(
     symbol: str,
     strategy_id: str,
@@ -312,34 +433,41 @@ def mark_signal_handled(
     signal_ts: str,
     action: str,
     db_path: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> bool:
     """Record a signal and return True if it was already processed.
 
     The unique key ``(strategy_id, symbol, timeframe, signal_ts, action)``
     is stored in ``processed_signals``. Subsequent calls with the same key
     return ``True`` without modifying state, allowing callers to skip
-    duplicate work.
+    duplicate work. ``conn`` may be a connection from :func:`get_connection`.
     """
     if db_path is None:
         db_path = _default_db_path()
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+    key = (db_path, strategy_id, symbol, timeframe, signal_ts, action)
+    with _HANDLED_SIGNALS_LOCK:
+        if key in _HANDLED_SIGNALS:
+            _HANDLED_SIGNALS.move_to_end(key)
+            return True
 
     try:
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            _create_processed_table(cursor)
-            try:
-                cursor.execute(
+        if conn is None:
+            _ensure_db_dir(db_path)
+            conn = sqlite3.connect(db_path)
+            _create_processed_table(conn.cursor())
+        try:
+            with conn:
+                conn.execute(
                     """
                     INSERT INTO processed_signals(strategy_id, symbol, timeframe, signal_ts, action)
                     VALUES (?, ?, ?, ?, ?)
                     """,
                     (strategy_id, symbol, timeframe, signal_ts, action),
                 )
-                conn.commit()
-                return False
-            except sqlite3.IntegrityError:
-                return True
+            handled = False
+        except sqlite3.IntegrityError:
+            handled = True
     except sqlite3.Error:
         logger.exception(
             "mark_signal_handled: Database error for symbol=%s strategy=%s timeframe=%s db_path=%s",
@@ -349,3 +477,9 @@ def mark_signal_handled(
             db_path,
         )
         raise
+
+    with _HANDLED_SIGNALS_LOCK:
+        _HANDLED_SIGNALS[key] = None
+        if len(_HANDLED_SIGNALS) > _HANDLED_SIGNALS_MAX:
+            _HANDLED_SIGNALS.popitem(last=False)
+    return handled
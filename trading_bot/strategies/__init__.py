@@ -26,6 +26,10 @@ class Strategy:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Module globals survive ``importlib.reload``, so the registry already being
+# defined means this package is being reloaded rather than imported fresh.
+_RELOADING = "STRATEGY_REGISTRY" in globals()
+
 # Global registry populated by the decorator below. When this module is
 # reloaded (e.g., during plugin discovery in tests), we reuse the existing
 # dictionary object so that external references remain valid.
@@ -58,11 +62,15 @@ def list_strategies() -> List[str]:
 
 
 # Automatically import all modules in this package so that any decorated
-# strategies are registered upon package import.
+# strategies are registered upon package import. A reload of this package
+# cleared the registry, so its already-imported modules are reloaded to
+# register again; on a fresh import each module runs exactly once.
 for _finder, module_name, _ispkg in pkgutil.iter_modules(__path__):
     full_name = f"{__name__}.{module_name}"
-    module = importlib.import_module(full_name)
-    importlib.reload(module)
+    if _RELOADING and full_name in sys.modules:
+        importlib.reload(sys.modules[full_name])
+    else:
+        importlib.import_module(full_name)
 
 
 def load_strategy_plugins(extra_paths: List[str] | None = None) -> None:
@@ -98,11 +106,6 @@ def load_strategy_plugins(extra_paths: List[str] | None = None) -> None:
             importlib.reload(module)
 
 
-# Automatically import all modules in this package so that any decorated
-# strategies are registered upon package import.
-for _finder, module_name, _ispkg in pkgutil.iter_modules(__path__):
-    importlib.import_module(f"{__name__}.{module_name}")
-
 # Load external strategy plugins after built-ins have registered
 load_strategy_plugins()
 
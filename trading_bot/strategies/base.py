@@ -9,8 +9,9 @@ contract to follow.
 
 from __future__ import annotations
 
-from typing import Any, List, Protocol
+from typing import Any, Dict, List, Protocol
 
+import numpy as np
 import pandas as pd
 
 
@@ -28,4 +29,26 @@ class StrategyProtocol(Protocol):
         ...
 
 
-__all__ = ["StrategyProtocol"]
+def signals_from_masks(df: pd.DataFrame, buy: np.ndarray, sell: np.ndarray) -> List[Dict[str, Any]]:
+    """Build signal dictionaries from vectorised crossover masks.
+
+    ``buy`` and ``sell`` are boolean arrays over consecutive row pairs, so
+    element ``i`` describes the move from row ``i`` to row ``i + 1`` and a
+    signal is emitted for row ``i + 1``. When both are set, ``buy`` wins,
+    matching an ``if``/``elif`` over the rows.
+    """
+    sell = sell & ~buy
+    pairs = np.flatnonzero(buy | sell)
+    if pairs.size == 0:
+        return []
+    rows = pairs + 1
+    timestamps = df["timestamp"].iloc[rows].tolist()
+    prices = df["close"].to_numpy(dtype=float)[rows].tolist()
+    actions = np.where(buy[pairs], "buy", "sell").tolist()
+    return [
+        {"timestamp": ts, "action": action, "price": price}
+        for ts, action, price in zip(timestamps, actions, prices)
+    ]
+
+
+__all__ = ["StrategyProtocol", "signals_from_masks"]
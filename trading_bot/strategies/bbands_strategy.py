@@ -1,13 +1,13 @@
 """Bollinger Bands crossover strategy implementation."""
 
 import logging
-from typing import Any, Dict, List
 
 import pandas as pd
 
 from trading_bot.types import Signals
 
 from trading_bot.strategies import register_strategy
+from trading_bot.strategies.base import signals_from_masks
 
 logger = logging.getLogger(__name__)
 
@@ -59,42 +59,16 @@ def bbands_strategy(
     d["upper_band"] = d["middle_band"] + num_std * d["std_dev"]
     d["lower_band"] = d["middle_band"] - num_std * d["std_dev"]
 
-    signals: List[Dict[str, Any]] = []
-
-    # Iterate to detect crossovers: below->above lower => BUY; above->below upper => SELL
-    for i in range(1, len(d)):
-        prev = d.iloc[i - 1]
-        curr = d.iloc[i]
-
-        # Skip until bands are fully formed
-        if pd.isna(curr["lower_band"]) or pd.isna(curr["upper_band"]):
-            continue
-
-        prev_close = float(prev["close"])
-        curr_close = float(curr["close"])
-        prev_lower = float(prev["lower_band"]) if pd.notna(prev["lower_band"]) else float("nan")
-        curr_lower = float(curr["lower_band"])
-        prev_upper = float(prev["upper_band"]) if pd.notna(prev["upper_band"]) else float("nan")
-        curr_upper = float(curr["upper_band"])
-
-        # BUY when price crosses up over the lower band
-        if pd.notna(prev_lower) and (prev_close < prev_lower) and (curr_close >= curr_lower):
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "buy",
-                    "price": curr_close,
-                }
-            )
-        # SELL when price crosses down under the upper band
-        elif pd.notna(prev_upper) and (prev_close > prev_upper) and (curr_close <= curr_upper):
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "sell",
-                    "price": curr_close,
-                }
-            )
+    close = d["close"].to_numpy(dtype=float)
+    lower = d["lower_band"].to_numpy()
+    upper = d["upper_band"].to_numpy()
+    prev_close, curr_close = close[:-1], close[1:]
+
+    # Price crossing up over the lower band -> BUY; down under the upper band
+    # -> SELL. Rows before the bands are formed are NaN and compare False.
+    buy = (prev_close < lower[:-1]) & (curr_close >= lower[1:])
+    sell = (prev_close > upper[:-1]) & (curr_close <= upper[1:])
+    signals = signals_from_masks(d, buy, sell)
 
     logger.info("Generated %d Bollinger band signals", len(signals))
     return signals
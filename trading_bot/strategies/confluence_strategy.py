@@ -44,7 +44,7 @@ def confluence_strategy(
     try:
         from trading_bot.strategies import STRATEGY_REGISTRY  # avoid circular import
     except ImportError as e:
-        logger.error(f"Failed to import STRATEGY_REGISTRY: {e}")
+        logger.error("Failed to import STRATEGY_REGISTRY: %s", e)
         return []
 
     # Collect signals from member strategies
@@ -53,12 +53,12 @@ def confluence_strategy(
         entry = STRATEGY_REGISTRY.get(name)
         strategy_fn = getattr(entry, "func", None)
         if not callable(strategy_fn):
-            logger.warning(f"Unknown strategy in confluence: {name}")
+            logger.warning("Unknown strategy in confluence: %s", name)
             continue
         try:
             signals = strategy_fn(df)
         except Exception as exc:
-            logger.exception(f"Error executing strategy '{name}': {exc}")
+            logger.exception("Error executing strategy '%s': %s", name, exc)
             continue
         for sig in signals:
             ts = sig["timestamp"]
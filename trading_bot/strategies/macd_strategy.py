@@ -1,13 +1,13 @@
 """MACD crossover strategy implementation."""
 
 import logging
-from typing import List, Dict, Any
 
 import pandas as pd
 
 from trading_bot.types import Signals
 
 from trading_bot.strategies import register_strategy
+from trading_bot.strategies.base import signals_from_masks
 
 logger = logging.getLogger(__name__)
 
@@ -59,45 +59,14 @@ def macd_strategy(
     # Signal line: EMA of the MACD line used for crossovers
     d["signal"] = d["macd"].ewm(span=signal_period, adjust=False).mean()
 
-    signals: List[Dict[str, Any]] = []
-
-    for i in range(1, len(d)):
-        prev = d.iloc[i - 1]
-        curr = d.iloc[i]
-
-        if pd.isna(prev["macd"]) or pd.isna(prev["signal"]) or pd.isna(curr["macd"]) or pd.isna(curr["signal"]):
-            continue
-
-        prev_macd = float(prev["macd"])
-        prev_signal = float(prev["signal"])
-        curr_macd = float(curr["macd"])
-        curr_signal = float(curr["signal"])
-
-        logger.debug(
-            "t=%s macd=%.6f signal=%.6f",
-            curr["timestamp"],
-            curr_macd,
-            curr_signal,
-        )
-
-        # Bullish crossover: MACD line crosses above the signal -> BUY
-        if prev_macd <= prev_signal and curr_macd > curr_signal:
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "buy",
-                    "price": float(curr["close"]),
-                }
-            )
-        # Bearish crossover: MACD line crosses below the signal -> SELL
-        elif prev_macd >= prev_signal and curr_macd < curr_signal:
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "sell",
-                    "price": float(curr["close"]),
-                }
-            )
+    macd = d["macd"].to_numpy()
+    signal_line = d["signal"].to_numpy()
+    prev_macd, prev_signal = macd[:-1], signal_line[:-1]
+    curr_macd, curr_signal = macd[1:], signal_line[1:]
+    # MACD line crossing above the signal line -> BUY, below -> SELL
+    buy = (prev_macd <= prev_signal) & (curr_macd > curr_signal)
+    sell = (prev_macd >= prev_signal) & (curr_macd < curr_signal)
+    signals = signals_from_masks(d, buy, sell)
 
     logger.info("Generated %d MACD signals", len(signals))
     return signals
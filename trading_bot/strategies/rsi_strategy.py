@@ -1,7 +1,6 @@
 """RSI threshold crossover strategy implementation."""
 
 import logging
-from typing import List, Dict, Any
 
 import numpy as np
 import pandas as pd
@@ -10,6 +9,7 @@ from trading_bot.types import Signals
 
 from trading_bot.config import get_config
 from trading_bot.strategies import register_strategy
+from trading_bot.strategies.base import signals_from_masks
 
 logger = logging.getLogger(__name__)
 
@@ -72,39 +72,12 @@ def rsi_strategy(
     rs = avg_gain / avg_loss  # relative strength
     d["rsi"] = 100.0 - (100.0 / (1.0 + rs))
 
-    signals: List[Dict[str, Any]] = []
-
-    for i in range(1, len(d)):
-        prev = d.iloc[i - 1]
-        curr = d.iloc[i]
-
-        if pd.isna(prev.get("rsi")) or pd.isna(curr.get("rsi")):
-            continue
-
-        prev_rsi = float(prev["rsi"])
-        curr_rsi = float(curr["rsi"])
-        curr_close = float(curr["close"])
-
-        logger.debug("t=%s rsi=%.2f prev_rsi=%.2f", curr["timestamp"], curr_rsi, prev_rsi)
-
-        # Cross up from below lower_thresh -> BUY
-        if prev_rsi <= lower_thresh and curr_rsi > lower_thresh:
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "buy",
-                    "price": curr_close,
-                }
-            )
-        # Cross down from above upper_thresh -> SELL
-        elif prev_rsi >= upper_thresh and curr_rsi < upper_thresh:
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "sell",
-                    "price": curr_close,
-                }
-            )
+    rsi = d["rsi"].to_numpy()
+    prev_rsi, curr_rsi = rsi[:-1], rsi[1:]
+    # Cross up from below lower_thresh -> BUY; cross down from above upper_thresh -> SELL
+    buy = (prev_rsi <= lower_thresh) & (curr_rsi > lower_thresh)
+    sell = (prev_rsi >= upper_thresh) & (curr_rsi < upper_thresh)
+    signals = signals_from_masks(d, buy, sell)
 
     logger.info("Generated %d RSI signals", len(signals))
     return signals
@@ -1,13 +1,13 @@
 """SMA crossover strategy implementation."""
 
 import logging
-from typing import List, Dict, Any
 
 import pandas as pd
 from trading_bot.types import Signals
 
 from trading_bot.config import get_config
 from trading_bot.strategies import register_strategy
+from trading_bot.strategies.base import signals_from_masks
 
 logger = logging.getLogger(__name__)
 
@@ -65,50 +65,15 @@ def sma_strategy(
     if not pd.api.types.is_datetime64_any_dtype(d["timestamp"]):
         d["timestamp"] = pd.to_datetime(d["timestamp"], utc=True, errors="coerce")
 
-    d[f"sma_{sma_short}"] = d["close"].rolling(window=sma_short, min_periods=sma_short).mean()
-    d[f"sma_{sma_long}"] = d["close"].rolling(window=sma_long, min_periods=sma_long).mean()
-
-    signals: List[Dict[str, Any]] = []
-
-    for i in range(1, len(d)):
-        prev = d.iloc[i - 1]
-        curr = d.iloc[i]
-
-        # Skip until both SMAs are available
-        if pd.isna(curr[f"sma_{sma_short}"]) or pd.isna(curr[f"sma_{sma_long}"]):
-            continue
-
-        prev_short = prev[f"sma_{sma_short}"]
-        prev_long = prev[f"sma_{sma_long}"]
-        curr_short = curr[f"sma_{sma_short}"]
-        curr_long = curr[f"sma_{sma_long}"]
-
-        logger.debug(
-            "t=%s price=%.6f short=%.6f long=%.6f",
-            curr["timestamp"],
-            float(curr["close"]),
-            float(curr_short),
-            float(curr_long),
-        )
-
-        # Bullish crossover: short crosses above long
-        if (prev_short <= prev_long) and (curr_short > curr_long):
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "buy",
-                    "price": float(curr["close"]),
-                }
-            )
-        # Bearish crossover: short crosses below long
-        elif (prev_short >= prev_long) and (curr_short < curr_long):
-            signals.append(
-                {
-                    "timestamp": curr["timestamp"],
-                    "action": "sell",
-                    "price": float(curr["close"]),
-                }
-            )
+    short = d["close"].rolling(window=sma_short, min_periods=sma_short).mean().to_numpy()
+    long = d["close"].rolling(window=sma_long, min_periods=sma_long).mean().to_numpy()
+
+    # Crossovers between consecutive rows; NaN warm-up rows compare False
+    prev_short, prev_long = short[:-1], long[:-1]
+    curr_short, curr_long = short[1:], long[1:]
+    buy = (prev_short <= prev_long) & (curr_short > curr_long)
+    sell = (prev_short >= prev_long) & (curr_short < curr_long)
+    signals = signals_from_masks(d, buy, sell)
 
     logger.info("Generated %d SMA signals", len(signals))
     return signals
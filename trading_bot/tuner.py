@@ -3,7 +3,6 @@ import itertools
 from typing import List, Dict, Any, Optional
 
 from trading_bot.backtester import (
-    run_backtest,
     load_csv_data,
     generate_signals,
     simulate_equity,
@@ -11,6 +10,18 @@ from trading_bot.backtester import (
 
 logger = logging.getLogger(__name__)
 
+# Grid keys that configure the simulation rather than the strategy, routed
+# the same way as in :func:`trading_bot.backtester.run_backtest`
+_SIMULATION_KEYS = (
+    "trade_size",
+    "fees_bps",
+    "slippage_bps",
+    "stop_loss_pct",
+    "take_profit_rr",
+    "trailing_stop_pct",
+    "max_position_pct",
+)
+
 DEFAULT_GRIDS: Dict[str, Dict[str, List[Any]]] = {
     "sma": {
         "sma_short": [5, 10, 15],
@@ -45,12 +56,19 @@ def tune(
 
     Returns:
         Sorted list of results (dict) with parameters and backtest metrics.
+
+    Raises:
+        ValueError: If no grid is given and the strategy has no default one.
+        FileNotFoundError: If ``csv_path`` does not exist.
     """
     if param_grid is None:
         if strategy not in DEFAULT_GRIDS:
             raise ValueError(f"No default grid for strategy: {strategy}")
         param_grid = DEFAULT_GRIDS[strategy]
 
+    # Parsed once and shared by every combination
+    df = load_csv_data(csv_path)
+
     keys = list(param_grid.keys())
     values = [param_grid[k] for k in keys]
 
@@ -59,7 +77,10 @@ def tune(
         params = dict(zip(keys, combo))
         logger.info("Testing parameters: %s", params)
         try:
-            stats = run_backtest(csv_path, strategy=strategy, **params)
+            sim_params = {k: v for k, v in params.items() if k in _SIMULATION_KEYS}
+            strategy_params = {k: v for k, v in params.items() if k not in _SIMULATION_KEYS}
+            signals = generate_signals(df, strategy=strategy, **strategy_params)
+            _, stats = simulate_equity(df, signals, **sim_params)
         except Exception as e:  # pragma: no cover - log and continue
             logger.exception("Error during backtest with params %s: %s", params, e)
             continue
@@ -91,13 +112,14 @@ def walk_forward_optimize(
     if train_size <= 0 or test_size <= 0:
         raise ValueError("train_size and test_size must be positive")
 
-    df = load_csv_data(csv_path)
-
     if param_grid is None:
         if strategy not in DEFAULT_GRIDS:
             raise ValueError(f"No default grid for strategy: {strategy}")
         param_grid = DEFAULT_GRIDS[strategy]
 
+    # Parsed once and shared by every combination
+    df = load_csv_data(csv_path)
+
     keys = list(param_grid.keys())
     values = [param_grid[k] for k in keys]
 
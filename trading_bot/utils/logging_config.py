@@ -4,11 +4,17 @@ import json
 import time
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from trading_bot.utils.state import default_state_dir
 
 
+# Handlers installed by the last setup_logging call and the (log path,
+# json_logs) pair they were built for
+_INSTALLED_HANDLERS: List[logging.Handler] = []
+_INSTALLED_KEY: Optional[Tuple[str, bool]] = None
+
+
 class JsonFormatter(logging.Formatter):
     """Format log records as JSON."""
 
@@ -34,12 +40,28 @@ def setup_logging(level: str = "INFO", state_dir: Optional[str] = None, json_log
     os.makedirs(logs_dir, exist_ok=True)
     log_path = os.path.join(logs_dir, "bot.log")
 
+    # Neither formatter uses process or thread fields, so skip collecting
+    # them for every LogRecord
+    logging.logProcesses = False
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+
+    global _INSTALLED_KEY
+
     root = logging.getLogger()
     root.setLevel(getattr(logging, level.upper(), logging.INFO))
 
+    # Repeated calls with the same destination keep the existing handlers
+    # rather than reopening the log file
+    key = (log_path, json_logs)
+    if key == _INSTALLED_KEY and root.handlers == _INSTALLED_HANDLERS:
+        return log_path
+
     # Remove existing handlers so reconfiguration works
     for handler in list(root.handlers):
         root.removeHandler(handler)
+    for handler in _INSTALLED_HANDLERS:
+        handler.close()
 
     formatter: logging.Formatter
     if json_logs:
@@ -59,4 +81,6 @@ def setup_logging(level: str = "INFO", state_dir: Optional[str] = None, json_log
     file_handler.setFormatter(formatter)
     root.addHandler(file_handler)
 
+    _INSTALLED_HANDLERS[:] = [console_handler, file_handler]
+    _INSTALLED_KEY = key
     return log_path
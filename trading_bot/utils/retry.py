@@ -4,8 +4,6 @@ import time
 from dataclasses import dataclass, field
 from typing import Callable, Optional, TypeVar
 
-import ccxt
-
 from trading_bot.notify import send as notify_send
 
 
@@ -48,7 +46,7 @@ class RetryPolicy:
         attempt = 0
         while True:
             if self._circuit_open():
-                logger.error(f"Circuit breaker open for {func.__name__}")
+                logger.error("Circuit breaker open for %s", func.__name__)
                 notify_send(f"Circuit breaker open for {func.__name__}")
                 raise RuntimeError("circuit breaker open")
             try:
@@ -58,26 +56,40 @@ class RetryPolicy:
             except Exception as e:  # pragma: no cover - generic catch
                 attempt += 1
                 self._record_failure()
+                import ccxt
+
                 if isinstance(e, ccxt.NetworkError):
                     logger.warning(
-                        f"{func.__name__} network error on attempt {attempt}: {e}",
+                        "%s network error on attempt %d: %s",
+                        func.__name__,
+                        attempt,
+                        e,
                         exc_info=True,
                     )
                     if attempt > self.retries:
                         logger.error(
-                            f"{func.__name__} network error after {self.retries} retries: {e}",
+                            "%s network error after %d retries: %s",
+                            func.__name__,
+                            self.retries,
+                            e,
                             exc_info=True,
                         )
                         raise
                     sleep = min(self.backoff * (2 ** (attempt - 1)), 1.0)
                 else:
                     logger.warning(
-                        f"{func.__name__} failed on attempt {attempt}: {e}",
+                        "%s failed on attempt %d: %s",
+                        func.__name__,
+                        attempt,
+                        e,
                         exc_info=True,
                     )
                     if attempt > self.retries:
                         logger.error(
-                            f"{func.__name__} failed after {self.retries} retries: {e}",
+                            "%s failed after %d retries: %s",
+                            func.__name__,
+                            self.retries,
+                            e,
                             exc_info=True,
                         )
                         raise